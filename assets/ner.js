@@ -0,0 +1,70 @@
+/* Placeholder for future clientside JavaScript functionality */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    clientside: {
+        handleTextSelection: function(n_clicks) {
+            return window.dash_clientside.no_update;
+        }
+    }
+});
+
+/* Delegated labeling: one listener covers all four label buttons via
+ * their data-label attribute, instead of four n_clicks Input
+ * subscriptions and a prop_id switch in a clientside callback. The
+ * selection start comes straight off the clicked word span's
+ * data-offset, and ids come from a session counter (small integers
+ * that compare exactly after a JSON round-trip). */
+document.addEventListener('click', function(e) {
+    const btn = e.target.closest('.ner-label-btn[data-label]');
+    if (!btn) return;
+
+    const setInfo = msg =>
+        window.dash_clientside.set_props('selection-info', {children: msg});
+
+    const selection = window.getSelection();
+    if (selection.rangeCount === 0 || selection.toString().trim() === '') {
+        setInfo('No text selected');
+        return;
+    }
+
+    const selectedText = selection.toString().trim();
+    const range = selection.getRangeAt(0);
+    const startSpan = range.startContainer.parentNode;
+    const start = parseInt((startSpan.dataset || {}).offset || '0', 10) + range.startOffset;
+
+    const newEntity = {
+        id: (window.__nerNextId = (window.__nerNextId || 0) + 1),
+        text: selectedText,
+        label: btn.dataset.label,
+        start: start,
+        end: start + selectedText.length
+    };
+
+    // The store is an id-keyed map; window.__nerEntities mirrors it.
+    // Refresh the mirror here, not just in the render callback - a second
+    // click landing before the render re-syncs it must not build on a
+    // stale copy and drop this entity.
+    const updated = Object.assign({}, window.__nerEntities);
+    updated[String(newEntity.id)] = newEntity;
+    window.__nerEntities = updated;
+
+    // Clear the selection to give visual feedback
+    selection.removeAllRanges();
+
+    window.dash_clientside.set_props('entities-store', {data: updated});
+    setInfo(`Labeled "${selectedText}" as ${newEntity.label}`);
+});
+
+/* Delegated entity removal: one listener on the document instead of a
+ * pattern-matched callback input per remove button, so clicks don't pay
+ * for re-evaluating an ALL-matched id list as the entity count grows.
+ * The card renderer mirrors the store into window.__nerEntities. */
+document.addEventListener('click', function(e) {
+    const btn = e.target.closest('.ner-remove-btn');
+    if (!btn || !window.__nerEntities) return;
+    const updated = Object.assign({}, window.__nerEntities);
+    delete updated[btn.dataset.entityId];
+    // Keep the mirror current so a second click before the next render
+    // doesn't resurrect the entity removed first
+    window.__nerEntities = updated;
+    window.dash_clientside.set_props('entities-store', {data: updated});
+});
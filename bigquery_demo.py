@@ -21,9 +21,13 @@ License: MIT
 
 import dash
 from dash import html, dcc, callback, Input, Output, State, ALL, ctx
+from dash.exceptions import PreventUpdate
 import json
-import pandas as pd
+import orjson
 from datetime import datetime
+import concurrent.futures
+import threading
+import time
 import uuid
 import os
 from typing import Dict, List, Optional
@@ -32,21 +36,42 @@ from typing import Dict, List, Optional
 from dash_ner_labeler import NERLabeler
 from bigquery_integration import BigQueryNERManager
 
+# Optional: shared server-side cache across gunicorn workers
+try:
+    from flask_caching import Cache
+except ImportError:
+    Cache = None
+
 # Initialize the Dash app
 app = dash.Dash(__name__)
 app.title = "BigQuery NER Labeler"
 
-# Global variables for demo (in production, use proper state management)
-current_texts_df = pd.DataFrame()
-current_text_index = 0
+# Per-process session identifier; per-browser state lives in dcc.Store
 session_id = str(uuid.uuid4())
 
+# Fixed label set for the labeler; LABEL_IDX lets the stats fold count into
+# a flat list by index instead of hashing label strings per entry
+LABEL_TYPES = ('PERSON', 'ORGANIZATION', 'LOCATION', 'MISCELLANEOUS', 'DATE', 'MONEY', 'PRODUCT')
+LABEL_IDX = {label: i for i, label in enumerate(LABEL_TYPES)}
+
+# Server-side lookup of loaded texts. The texts-store dcc.Store only carries
+# the small list of text IDs, so callbacks stop round-tripping every loaded
+# document between the browser and Python on each click. With flask-caching
+# installed the rows live in the shared FileSystemCache, so the worker that
+# serves a navigation click sees the rows another worker loaded; this dict
+# is the single-process fallback.
+TEXTS_BY_ID: Dict[str, Dict] = {}
+
 # Demo configuration (replace with your actual BigQuery config)
 DEMO_CONFIG = {
     "project_id": "your-project-id",  # Replace with your GCP project ID
     "dataset_id": "ner_labeling",
     "credentials_path": None,  # Will use default credentials
-    "batch_size": 5
+    "batch_size": 5,
+    # Partition-pruning window for the pending-texts query (in days)
+    "min_lookback_days": 3,
+    "max_lookback_days": 30,
+    "late_buffer_days": 2
 }
 
 # Initialize BigQuery manager (will be None in demo mode)
@@ -80,9 +105,214 @@ def initialize_bigquery():
 # Initialize on startup
 initialize_bigquery()
 
+# ========================================
+# QUERY CACHE
+# ========================================
+# Process-local TTL cache for BigQuery reads. Without it, every navigation
+# click re-runs load_existing_annotations and every "Load" press re-issues
+# the same pending-texts query - each one a network round trip plus
+# bytes-scanned billing.
+
+CACHE_TTL_SECONDS = 60
+
+# With flask-caching installed, reads go through a FileSystemCache that all
+# gunicorn workers share, so a page fetched by one worker is a hit in the
+# others. Without it we fall back to the per-process dict below.
+if Cache is not None:
+    server_cache = Cache(app.server, config={
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': '.dash_cache',
+        'CACHE_DEFAULT_TIMEOUT': CACHE_TTL_SECONDS
+    })
+else:
+    server_cache = None
+
+_query_cache = {}   # cache key -> (timestamp, value)
+_cache_locks = {}   # cache key -> lock, so concurrent workers don't stampede
+_cache_guard = threading.Lock()
+
+def _get_cache_lock(key):
+    """Get (or create) the lock guarding a single cache key"""
+    with _cache_guard:
+        lock = _cache_locks.get(key)
+        if lock is None:
+            lock = _cache_locks[key] = threading.Lock()
+        return lock
+
+def _cached_query(key, loader):
+    """Run loader() at most once per TTL window for the given cache key"""
+    with _get_cache_lock(key):
+        if server_cache is not None:
+            value = server_cache.get(str(key))
+            if value is None:
+                value = loader()
+                server_cache.set(str(key), value)
+            return value
+        cached = _query_cache.get(key)
+        if cached and time.time() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+        value = loader()
+        _query_cache[key] = (time.time(), value)
+        return value
+
+def _cached_load_annotations(text_id):
+    """Load existing annotations for a text, caching the result briefly"""
+    return _cached_query(('annotations', text_id),
+                         lambda: bq_manager.load_existing_annotations(text_id))
+
+# Adaptive lookback window for partition pruning: start narrow, widen when a
+# page comes back short, and snap back once recent days fill a full page
+current_lookback_days = DEMO_CONFIG["min_lookback_days"]
+
+def _effective_lookback_days():
+    """Lookback window for the next pending-texts query, with late-data buffer"""
+    return current_lookback_days + DEMO_CONFIG["late_buffer_days"]
+
+def _adapt_lookback(rows_returned, batch_size):
+    """Widen or reset the lookback window based on how full the page was"""
+    global current_lookback_days
+    if rows_returned < batch_size:
+        current_lookback_days = min(current_lookback_days * 2,
+                                    DEMO_CONFIG["max_lookback_days"])
+    else:
+        current_lookback_days = DEMO_CONFIG["min_lookback_days"]
+
+def _cached_load_texts(batch_size, cursor=None):
+    """Load pending texts for annotation, caching the result briefly"""
+    cursor = tuple(cursor) if cursor else None
+    lookback_days = _effective_lookback_days()
+    return _cached_query(('texts', batch_size, cursor, lookback_days),
+                         lambda: bq_manager.load_texts_for_annotation(
+                             limit=batch_size, cursor=cursor,
+                             lookback_days=lookback_days))
+
+def _invalidate_annotation_cache(text_id):
+    """Drop cached annotations for a text after a successful upload"""
+    key = ('annotations', text_id)
+    if server_cache is not None:
+        server_cache.delete(str(key))
+    _query_cache.pop(key, None)
+
+# ========================================
+# ANNOTATION PREFETCH
+# ========================================
+# Fetch annotations for upcoming texts in the background so navigation
+# clicks read from an already-completed future instead of stalling the
+# callback thread on a BigQuery round trip.
+
+PREFETCH_DEPTH = 3
+
+_prefetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+_prefetch_futures = {}  # text_id -> Future
+_prefetch_lock = threading.Lock()
+
+def prefetch_annotations(text_ids):
+    """Queue background annotation fetches for the given text IDs"""
+    if demo_mode or not bq_manager:
+        return
+    with _prefetch_lock:
+        for text_id in text_ids:
+            if text_id and text_id not in _prefetch_futures:
+                _prefetch_futures[text_id] = _prefetch_pool.submit(
+                    _cached_load_annotations, text_id)
+
+# ========================================
+# ASYNC UPLOADS
+# ========================================
+# Saving to BigQuery is a network write that can take seconds; running it
+# on the callback thread pins a Dash worker for the duration. Uploads are
+# submitted to a small pool instead, and a polling interval reports
+# completion back to the UI.
+
+UPLOAD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+_pending_uploads = {}  # text_id -> Future (single-process fallback)
+_pending_uploads_lock = threading.Lock()
+
+# The upload future runs inside the worker that accepted the save, but the
+# upload-poll interval can land on any worker. Outcomes are therefore
+# published to the shared cache under upload:<text_id>, and the poll reads
+# the in-flight ID list from the browser-side pending-uploads store rather
+# than from this process's future map.
+_UPLOAD_STATUS_TTL = 600
+
+def _record_upload_result(text_id, future):
+    """Publish a finished upload's outcome where any worker's poll sees it"""
+    try:
+        succeeded = bool(future.result())
+    except Exception:
+        succeeded = False
+    server_cache.set(f"upload:{text_id}", 'done' if succeeded else 'failed',
+                     timeout=_UPLOAD_STATUS_TTL)
+    with _pending_uploads_lock:
+        _pending_uploads.pop(text_id, None)
+
+def submit_upload(text_id, entities, user_id, username, session_id):
+    """Submit an annotation upload without blocking the callback thread"""
+    future = UPLOAD_POOL.submit(
+        bq_manager.upload_annotations,
+        text_id=text_id,
+        entities=entities,
+        user_id=user_id,
+        username=username,
+        session_id=session_id
+    )
+    with _pending_uploads_lock:
+        _pending_uploads[text_id] = future
+    if server_cache is not None:
+        server_cache.set(f"upload:{text_id}", 'pending',
+                         timeout=_UPLOAD_STATUS_TTL)
+        future.add_done_callback(
+            lambda f, text_id=text_id: _record_upload_result(text_id, f))
+
+def collect_finished_uploads(pending_ids):
+    """Resolve outcomes for the given in-flight text IDs
+
+    Returns (finished, still_pending), where finished holds
+    (text_id, succeeded) pairs. With the shared cache, outcomes published
+    by whichever worker ran the upload are visible here; the fallback
+    reads this process's future map directly (single-worker debug server).
+    """
+    finished = []
+    still_pending = []
+    if server_cache is not None:
+        for text_id in pending_ids:
+            status = server_cache.get(f"upload:{text_id}")
+            if status == 'pending':
+                still_pending.append(text_id)
+            elif status in ('done', 'failed'):
+                server_cache.delete(f"upload:{text_id}")
+                finished.append((text_id, status == 'done'))
+            # None: expired or already reported - stop tracking the id
+        return finished, still_pending
+    with _pending_uploads_lock:
+        for text_id in pending_ids:
+            future = _pending_uploads.get(text_id)
+            if future is None:
+                continue
+            if not future.done():
+                still_pending.append(text_id)
+                continue
+            del _pending_uploads[text_id]
+            try:
+                finished.append((text_id, bool(future.result())))
+            except Exception:
+                finished.append((text_id, False))
+    return finished, still_pending
+
+def get_annotations_with_prefetch(text_id):
+    """Read a prefetched annotation result, falling back to a direct fetch"""
+    with _prefetch_lock:
+        future = _prefetch_futures.pop(text_id, None)
+    if future is not None:
+        try:
+            return future.result(timeout=0.5)
+        except Exception as e:
+            print(f"Prefetch failed for {text_id}, fetching directly: {e}")
+    return _cached_load_annotations(text_id)
+
 def create_demo_texts():
     """Create sample texts for demo mode"""
-    return pd.DataFrame([
+    return [
         {
             "text_id": "text_001",
             "text_content": "Apple Inc. is an American multinational technology company headquartered in Cupertino, California. Tim Cook serves as the CEO, succeeding Steve Jobs who co-founded the company with Steve Wozniak.",
@@ -118,16 +348,67 @@ def create_demo_texts():
             "status": "pending", 
             "priority": 5
         }
-    ])
+    ]
+
+# Last few history entries kept for the audit view, maintained incrementally
+# by the stats fold so rendering never slices the full history list
+RECENT_HISTORY_LEN = 10
+
+def _empty_stats():
+    """Fresh running-aggregate state for the statistics dashboard"""
+    return {'label_counts': [0] * len(LABEL_TYPES), 'user_activity': {},
+            'recent': [], 'history_len': 0}
+
+# Loaded text rows must outlive the short query-cache TTL, but a finite
+# timeout keeps the on-disk cache from growing without bound across loads;
+# a working session rarely keeps one page open longer than a day
+TEXT_ROW_TTL_SECONDS = 24 * 3600
+
+def _index_loaded_texts(records):
+    """Index loaded rows by text_id server-side and return the ID list"""
+    if server_cache is not None:
+        server_cache.set_many({f"text:{r['text_id']}": r for r in records},
+                              timeout=TEXT_ROW_TTL_SECONDS)
+    else:
+        TEXTS_BY_ID.update({r['text_id']: r for r in records})
+    return [r['text_id'] for r in records]
+
+def _get_loaded_text(text_id):
+    """Look up a loaded row by text_id, whichever worker loaded it"""
+    if server_cache is not None:
+        return server_cache.get(f"text:{text_id}") or {}
+    return TEXTS_BY_ID.get(text_id, {})
 
 # ========================================
 # APP LAYOUT DEFINITION
 # ========================================
 
+# Shared button styles - one dict per button role instead of a fresh
+# literal per html.Button, and a smaller serialized layout
+BTN_BASE = {'color': 'white', 'border': 'none', 'borderRadius': '5px', 'cursor': 'pointer'}
+BTN_LARGE = {**BTN_BASE, 'padding': '10px 20px', 'fontSize': '14px'}
+BTN_SMALL = {**BTN_BASE, 'padding': '8px 16px', 'fontSize': '12px'}
+
+LOAD_BTN_STYLE = {**BTN_LARGE, 'backgroundColor': '#3498db', 'marginRight': '10px'}
+DEMO_BTN_STYLE = {**BTN_LARGE, 'backgroundColor': '#e74c3c', 'marginRight': '10px'}
+PREV_BTN_STYLE = {**BTN_SMALL, 'backgroundColor': '#95a5a6', 'marginRight': '10px'}
+NEXT_BTN_STYLE = {**BTN_SMALL, 'backgroundColor': '#95a5a6', 'marginRight': '20px'}
+SAVE_BTN_STYLE = {**BTN_SMALL, 'backgroundColor': '#27ae60'}
+EXPORT_BTN_STYLE = {**BTN_LARGE, 'backgroundColor': '#8e44ad', 'marginRight': '10px'}
+AUDIT_BTN_STYLE = {**BTN_LARGE, 'backgroundColor': '#f39c12'}
+
 app.layout = html.Div([
     # Store components for state management
-    dcc.Store(id='texts-store', data=[]),
+    # Holds only the ordered list of loaded text IDs; full rows live in
+    # the server-side text lookup (shared cache or fallback map)
+    dcc.Store(id='texts-store', data=[], storage_type='session'),
+    dcc.Store(id='annotations-cache', data={}),
+    dcc.Store(id='page-cursor', data=None),
     dcc.Store(id='current-text-index', data=0),
+    dcc.Store(id='pending-uploads', data=[]),
+    dcc.Store(id='stats-agg', data=None),
+    dcc.Store(id='texts-count', data=0),
+    dcc.Interval(id='upload-poll', interval=1000, disabled=True),
     dcc.Store(id='session-id', data=session_id),
     dcc.Store(id='bigquery-status', data={"connected": not demo_mode, "demo_mode": demo_mode}),
     
@@ -149,15 +430,11 @@ app.layout = html.Div([
         html.Div([
             html.H4("🔄 Load Texts", style={'color': '#34495e', 'marginBottom': 10}),
             html.Div([
-                html.Button("📥 Load from BigQuery", id="load-bigquery-btn", 
-                           style={'backgroundColor': '#3498db', 'color': 'white', 'border': 'none',
-                                 'padding': '10px 20px', 'borderRadius': '5px', 'cursor': 'pointer',
-                                 'marginRight': '10px', 'fontSize': '14px'},
+                html.Button("📥 Load from BigQuery", id="load-bigquery-btn",
+                           style=LOAD_BTN_STYLE,
                            disabled=demo_mode),
                 html.Button("🎯 Load Demo Data", id="load-demo-btn",
-                           style={'backgroundColor': '#e74c3c', 'color': 'white', 'border': 'none',
-                                 'padding': '10px 20px', 'borderRadius': '5px', 'cursor': 'pointer',
-                                 'marginRight': '10px', 'fontSize': '14px'}),
+                           style=DEMO_BTN_STYLE),
                 dcc.Input(id="batch-size-input", type="number", value=5, min=1, max=50,
                          style={'padding': '10px', 'borderRadius': '5px', 'border': '1px solid #ddd',
                                'width': '80px', 'marginRight': '10px'}),
@@ -167,20 +444,14 @@ app.layout = html.Div([
             # Navigation controls
             html.Div([
                 html.Button("⬅️ Previous", id="prev-text-btn",
-                           style={'backgroundColor': '#95a5a6', 'color': 'white', 'border': 'none',
-                                 'padding': '8px 16px', 'borderRadius': '5px', 'cursor': 'pointer',
-                                 'marginRight': '10px', 'fontSize': '12px'},
+                           style=PREV_BTN_STYLE,
                            disabled=True),
                 html.Span(id="text-counter", style={'color': '#2c3e50', 'fontWeight': 'bold', 'marginRight': '10px'}),
                 html.Button("Next ➡️", id="next-text-btn",
-                           style={'backgroundColor': '#95a5a6', 'color': 'white', 'border': 'none',
-                                 'padding': '8px 16px', 'borderRadius': '5px', 'cursor': 'pointer',
-                                 'marginRight': '20px', 'fontSize': '12px'},
+                           style=NEXT_BTN_STYLE,
                            disabled=True),
                 html.Button("💾 Save to BigQuery", id="save-bigquery-btn",
-                           style={'backgroundColor': '#27ae60', 'color': 'white', 'border': 'none',
-                                 'padding': '8px 16px', 'borderRadius': '5px', 'cursor': 'pointer',
-                                 'fontSize': '12px'},
+                           style=SAVE_BTN_STYLE,
                            disabled=True)
             ], style={'display': 'flex', 'alignItems': 'center', 'marginBottom': 15}),
         ], style={'backgroundColor': '#ecf0f1', 'padding': '15px', 'borderRadius': '8px', 'marginBottom': '15px'}),
@@ -199,7 +470,7 @@ app.layout = html.Div([
             id='ner-labeler',
             text="",
             entities=[],
-            labelTypes=['PERSON', 'ORGANIZATION', 'LOCATION', 'MISCELLANEOUS', 'DATE', 'MONEY', 'PRODUCT'],
+            labelTypes=list(LABEL_TYPES),
             currentUser=None,
             annotationHistory=[],
             showUserInfo=True,
@@ -212,7 +483,10 @@ app.layout = html.Div([
     # Statistics Dashboard
     html.Div([
         html.H3("📊 Annotation Dashboard", style={'color': '#2c3e50', 'marginBottom': 15}),
-        html.Div(id='statistics-dashboard', style={
+        html.Div([
+            html.Div(id='current-text-stats', style={'display': 'contents'}),
+            html.Div(id='progress-stats', style={'display': 'contents'})
+        ], id='statistics-dashboard', style={
             'display': 'grid',
             'gridTemplateColumns': 'repeat(auto-fit, minmax(250px, 1fr))',
             'gap': '15px',
@@ -231,13 +505,9 @@ app.layout = html.Div([
         html.H3("📤 Export & Audit", style={'color': '#2c3e50', 'marginBottom': 15}),
         html.Div([
             html.Button("📋 Export Current Session", id="export-session-btn",
-                       style={'backgroundColor': '#8e44ad', 'color': 'white', 'border': 'none',
-                             'padding': '10px 20px', 'borderRadius': '5px', 'cursor': 'pointer',
-                             'marginRight': '10px', 'fontSize': '14px'}),
+                       style=EXPORT_BTN_STYLE),
             html.Button("📊 View Audit Trail", id="view-audit-btn",
-                       style={'backgroundColor': '#f39c12', 'color': 'white', 'border': 'none',
-                             'padding': '10px 20px', 'borderRadius': '5px', 'cursor': 'pointer',
-                             'fontSize': '14px'})
+                       style=AUDIT_BTN_STYLE)
         ], style={'marginBottom': '15px'}),
         
         html.Div(id='export-display')
@@ -274,49 +544,58 @@ def display_bigquery_status(status):
 
 @callback(
     [Output('texts-store', 'data'),
+     Output('annotations-cache', 'data'),
+     Output('page-cursor', 'data'),
      Output('current-text-index', 'data'),
+     Output('stats-agg', 'data'),
      Output('status-messages', 'children')],
     [Input('load-bigquery-btn', 'n_clicks'),
      Input('load-demo-btn', 'n_clicks')],
-    [State('batch-size-input', 'value')]
+    [State('batch-size-input', 'value'),
+     State('page-cursor', 'data')]
 )
-def load_texts(bigquery_clicks, demo_clicks, batch_size):
+def load_texts(bigquery_clicks, demo_clicks, batch_size, page_cursor):
     """Load texts from BigQuery or demo data"""
-    global current_texts_df
-    
     if not ctx.triggered:
-        return [], 0, ""
-    
+        return [], {}, None, 0, _empty_stats(), ""
+
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
+
     try:
         if button_id == 'load-bigquery-btn' and not demo_mode:
-            # Load from BigQuery
-            df = bq_manager.load_texts_for_annotation(limit=batch_size or 5)
-            if not df.empty:
-                current_texts_df = df
-                message = html.Div(f"✅ Loaded {len(df)} texts from BigQuery", 
+            # Load the next page of pending texts via keyset pagination -
+            # the cursor marks the last row of the previous page
+            records = _cached_load_texts(batch_size or 5, cursor=page_cursor)
+            _adapt_lookback(len(records), batch_size or 5)
+            if records:
+                text_ids = _index_loaded_texts(records)
+                # Fetch annotations for the whole page in a single query
+                # instead of one BigQuery job per displayed text
+                annotations_cache = bq_manager.load_existing_annotations_bulk(text_ids)
+                last_row = records[-1]
+                next_cursor = [last_row.get('priority'), last_row.get('text_id')]
+                message = html.Div(f"✅ Loaded {len(records)} texts from BigQuery",
                                   style={'color': '#27ae60', 'fontWeight': 'bold'})
-                return df.to_dict('records'), 0, message
+                return text_ids, annotations_cache, next_cursor, 0, _empty_stats(), message
             else:
-                message = html.Div("⚠️ No pending texts found in BigQuery", 
+                message = html.Div("⚠️ No pending texts found in BigQuery",
                                   style={'color': '#f39c12', 'fontWeight': 'bold'})
-                return [], 0, message
-                
+                return [], {}, None, 0, _empty_stats(), message
+
         elif button_id == 'load-demo-btn':
             # Load demo data
-            df = create_demo_texts()
-            current_texts_df = df
-            message = html.Div(f"✅ Loaded {len(df)} demo texts", 
+            records = create_demo_texts()
+            text_ids = _index_loaded_texts(records)
+            message = html.Div(f"✅ Loaded {len(records)} demo texts",
                               style={'color': '#27ae60', 'fontWeight': 'bold'})
-            return df.to_dict('records'), 0, message
-            
+            return text_ids, {}, None, 0, _empty_stats(), message
+
     except Exception as e:
-        message = html.Div(f"❌ Error loading texts: {str(e)}", 
+        message = html.Div(f"❌ Error loading texts: {str(e)}",
                           style={'color': '#e74c3c', 'fontWeight': 'bold'})
-        return [], 0, message
-    
-    return [], 0, ""
+        return [], {}, None, 0, _empty_stats(), message
+
+    return [], {}, None, 0, _empty_stats(), ""
 
 @callback(
     [Output('current-text-index', 'data', allow_duplicate=True),
@@ -356,24 +635,34 @@ def navigate_texts(prev_clicks, next_clicks, current_index, texts_data):
      Output('current-text-info', 'children'),
      Output('text-counter', 'children')],
     [Input('current-text-index', 'data')],
-    [State('texts-store', 'data')]
+    [State('texts-store', 'data'),
+     State('annotations-cache', 'data')]
 )
-def update_current_text(current_index, texts_data):
+def update_current_text(current_index, texts_data, annotations_cache):
     """Update the NER labeler with current text"""
-    if not texts_data or current_index >= len(texts_data):
+    if not texts_data:
+        # Nothing loaded yet - skip the initial render entirely
+        raise PreventUpdate
+    if current_index >= len(texts_data):
         return "", [], "", "No texts loaded"
-    
-    current_text_data = texts_data[current_index]
-    text_id = current_text_data.get('text_id', f'text_{current_index}')
+
+    text_id = texts_data[current_index]
+    current_text_data = _get_loaded_text(text_id)
     text_content = current_text_data.get('text_content', '')
-    
+
     # Load existing annotations if connected to BigQuery
     existing_entities = []
     if not demo_mode and bq_manager:
-        try:
-            existing_entities = bq_manager.load_existing_annotations(text_id)
-        except Exception as e:
-            print(f"Failed to load existing annotations: {e}")
+        if annotations_cache and text_id in annotations_cache:
+            # Bulk-loaded alongside the texts, so no extra query here
+            existing_entities = annotations_cache[text_id]
+        else:
+            try:
+                existing_entities = get_annotations_with_prefetch(text_id)
+            except Exception as e:
+                print(f"Failed to load existing annotations: {e}")
+            # Warm the cache for the texts the user is likely to visit next
+            prefetch_annotations(texts_data[current_index + 1:current_index + PREFETCH_DEPTH])
     
     # Create text info display
     text_info = html.Div([
@@ -397,122 +686,188 @@ def update_current_text(current_index, texts_data):
     return text_content, existing_entities, text_info, counter
 
 @callback(
-    Output('status-messages', 'children', allow_duplicate=True),
+    [Output('status-messages', 'children', allow_duplicate=True),
+     Output('pending-uploads', 'data'),
+     Output('upload-poll', 'disabled')],
     Input('save-bigquery-btn', 'n_clicks'),
     [State('ner-labeler', 'entities'),
      State('ner-labeler', 'currentUser'),
      State('current-text-index', 'data'),
      State('texts-store', 'data'),
-     State('session-id', 'data')],
+     State('session-id', 'data'),
+     State('pending-uploads', 'data')],
     prevent_initial_call=True
 )
-def save_annotations_to_bigquery(n_clicks, entities, current_user, current_index, texts_data, session_id):
-    """Save current annotations to BigQuery"""
+def save_annotations_to_bigquery(n_clicks, entities, current_user, current_index, texts_data, session_id, pending_ids):
+    """Queue the current annotations for upload to BigQuery"""
     if not n_clicks or not texts_data or current_index >= len(texts_data):
-        return ""
-    
+        return "", dash.no_update, dash.no_update
+
     if not current_user or not current_user.get('name'):
-        return html.Div("⚠️ Please set a username before saving annotations", 
-                       style={'color': '#f39c12', 'fontWeight': 'bold'})
-    
+        return html.Div("⚠️ Please set a username before saving annotations",
+                       style={'color': '#f39c12', 'fontWeight': 'bold'}), dash.no_update, dash.no_update
+
     try:
-        current_text_data = texts_data[current_index]
-        text_id = current_text_data.get('text_id', f'text_{current_index}')
-        
+        text_id = texts_data[current_index]
+
         if demo_mode:
             # Demo mode - just show success message
             return html.Div([
                 f"✅ Demo: Would save {len(entities or [])} annotations for text {text_id}",
                 html.Br(),
-                html.Small(f"User: {current_user['name']}, Session: {session_id[:8]}...", 
+                html.Small(f"User: {current_user['name']}, Session: {session_id[:8]}...",
                           style={'color': '#7f8c8d'})
-            ], style={'color': '#27ae60', 'fontWeight': 'bold'})
-        
-        # Real BigQuery save
-        success = bq_manager.upload_annotations(
+            ], style={'color': '#27ae60', 'fontWeight': 'bold'}), dash.no_update, dash.no_update
+
+        # Hand the upload to the background pool and return immediately;
+        # the upload-poll interval reports completion
+        submit_upload(
             text_id=text_id,
             entities=entities or [],
             user_id=current_user.get('id', 'unknown'),
             username=current_user['name'],
             session_id=session_id
         )
-        
-        if success:
-            return html.Div([
-                f"✅ Saved {len(entities or [])} annotations to BigQuery",
-                html.Br(),
-                html.Small(f"Text: {text_id}, User: {current_user['name']}", 
-                          style={'color': '#7f8c8d'})
-            ], style={'color': '#27ae60', 'fontWeight': 'bold'})
-        else:
-            return html.Div("❌ Failed to save annotations to BigQuery", 
-                           style={'color': '#e74c3c', 'fontWeight': 'bold'})
-            
+
+        pending_ids = [t for t in (pending_ids or []) if t != text_id] + [text_id]
+
+        return html.Div([
+            f"⏳ Saving {len(entities or [])} annotations to BigQuery…",
+            html.Br(),
+            html.Small(f"Text: {text_id}, User: {current_user['name']}",
+                      style={'color': '#7f8c8d'})
+        ], style={'color': '#f39c12', 'fontWeight': 'bold'}), pending_ids, False
+
     except Exception as e:
-        return html.Div(f"❌ Error saving to BigQuery: {str(e)}", 
-                       style={'color': '#e74c3c', 'fontWeight': 'bold'})
+        return html.Div(f"❌ Error saving to BigQuery: {str(e)}",
+                       style={'color': '#e74c3c', 'fontWeight': 'bold'}), dash.no_update, dash.no_update
+
+@callback(
+    [Output('status-messages', 'children', allow_duplicate=True),
+     Output('pending-uploads', 'data', allow_duplicate=True),
+     Output('upload-poll', 'disabled', allow_duplicate=True),
+     Output('annotations-cache', 'data', allow_duplicate=True)],
+    Input('upload-poll', 'n_intervals'),
+    [State('pending-uploads', 'data'),
+     State('annotations-cache', 'data')],
+    prevent_initial_call=True
+)
+def poll_pending_uploads(n_intervals, pending_ids, annotations_cache):
+    """Report completed background uploads and stop polling when idle"""
+    finished, still_pending = collect_finished_uploads(pending_ids or [])
+
+    if not finished:
+        return dash.no_update, still_pending, not still_pending, dash.no_update
+
+    messages = []
+    annotations_cache = dict(annotations_cache or {})
+    cache_changed = False
+    for text_id, succeeded in finished:
+        if succeeded:
+            _invalidate_annotation_cache(text_id)
+            # Drop the browser-side copy too: update_current_text prefers
+            # annotations-cache, so navigating back to a just-saved text
+            # would otherwise render the stale pre-save entity list
+            if annotations_cache.pop(text_id, None) is not None:
+                cache_changed = True
+            messages.append(html.Div(f"✅ Saved annotations for text {text_id} to BigQuery",
+                                     style={'color': '#27ae60', 'fontWeight': 'bold'}))
+        else:
+            messages.append(html.Div(f"❌ Failed to save annotations for text {text_id}",
+                                     style={'color': '#e74c3c', 'fontWeight': 'bold'}))
+
+    return (messages, still_pending, not still_pending,
+            annotations_cache if cache_changed else dash.no_update)
+
+@callback(
+    Output('stats-agg', 'data', allow_duplicate=True),
+    Input('ner-labeler', 'annotationHistory'),
+    State('stats-agg', 'data'),
+    prevent_initial_call=True
+)
+def update_stats_aggregates(history, agg):
+    """Fold only new history entries into the running aggregates
+
+    Keeps the dashboard O(1) per annotation action instead of rescanning
+    the full entity/history lists on every update.
+    """
+    history = history or []
+    agg = agg or _empty_stats()
+    seen = agg.get('history_len', 0)
+    if len(history) < seen:
+        # History was reset (e.g. texts reloaded) - start over
+        agg = _empty_stats()
+        seen = 0
+
+    label_counts = agg['label_counts']
+    user_activity = agg['user_activity']
+    recent = agg.setdefault('recent', [])
+
+    for entry in history[seen:]:
+        recent.append(entry)
+        action = entry.get('action', 'add')
+        label_i = LABEL_IDX.get((entry.get('entity') or {}).get('label'))
+        if label_i is not None:
+            label_counts[label_i] += 1 if action == 'add' else -1
+        username = entry.get('username', 'Unknown')
+        per_user = user_activity.setdefault(username, {'add': 0, 'remove': 0})
+        per_user[action] = per_user.get(action, 0) + 1
+
+    agg['recent'] = recent[-RECENT_HISTORY_LEN:]
+    agg['history_len'] = len(history)
+    return agg
+
+# Shared stat-card styles - hoisted so every dashboard render reuses the
+# same dicts instead of reallocating them per callback
+STAT_CARD_STYLE = {'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'}
+STAT_TITLE_STYLE = {'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}
+STAT_VALUE_STYLE = {'margin': '5px 0', 'color': '#2c3e50'}
+STAT_CAPTION_STYLE = {'margin': 0, 'fontSize': '12px', 'color': '#7f8c8d'}
 
 @callback(
-    Output('statistics-dashboard', 'children'),
+    Output('texts-count', 'data'),
+    Input('texts-store', 'data')
+)
+def update_texts_count(texts_data):
+    """Track the loaded text count so progress stats don't depend on the full store"""
+    return len(texts_data) if texts_data else 0
+
+@callback(
+    Output('current-text-stats', 'children'),
     [Input('ner-labeler', 'entities'),
-     Input('ner-labeler', 'annotationHistory'),
-     Input('current-text-index', 'data'),
-     Input('texts-store', 'data')]
+     Input('stats-agg', 'data')],
+    prevent_initial_call=True
 )
-def update_statistics_dashboard(entities, history, current_index, texts_data):
-    """Update the statistics dashboard"""
+def update_current_text_stats(entities, stats_agg):
+    """Render the per-text and session stat cards from precomputed aggregates"""
     entities = entities or []
-    history = history or []
-    
+    stats_agg = stats_agg or _empty_stats()
+
     # Current session stats
     total_entities = len(entities)
-    entity_types = {}
-    for entity in entities:
-        label = entity['label']
-        entity_types[label] = entity_types.get(label, 0) + 1
-    
-    # User activity
-    user_activity = {}
-    for entry in history:
-        username = entry.get('username', 'Unknown')
-        if username not in user_activity:
-            user_activity[username] = {'add': 0, 'remove': 0}
-        user_activity[username][entry['action']] += 1
-    
-    # Progress stats
-    texts_completed = current_index if texts_data else 0
-    total_texts = len(texts_data) if texts_data else 0
-    progress_percentage = (texts_completed / total_texts * 100) if total_texts > 0 else 0
-    
+    label_counts = stats_agg['label_counts']
+    user_activity = stats_agg['user_activity']
+
     stats_cards = []
-    
+
     # Current text stats
     stats_cards.append(
         html.Div([
-            html.H4("📝 Current Text", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-            html.H2(str(total_entities), style={'margin': '5px 0', 'color': '#2c3e50'}),
-            html.P("entities annotated", style={'margin': 0, 'fontSize': '12px', 'color': '#7f8c8d'})
-        ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
+            html.H4("📝 Current Text", style=STAT_TITLE_STYLE),
+            html.H2(str(total_entities), style=STAT_VALUE_STYLE),
+            html.P("entities annotated", style=STAT_CAPTION_STYLE)
+        ], style=STAT_CARD_STYLE)
     )
-    
-    # Progress card
-    stats_cards.append(
-        html.Div([
-            html.H4("📊 Progress", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-            html.H2(f"{progress_percentage:.1f}%", style={'margin': '5px 0', 'color': '#2c3e50'}),
-            html.P(f"{texts_completed}/{total_texts} texts", style={'margin': 0, 'fontSize': '12px', 'color': '#7f8c8d'})
-        ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
-    )
-    
+
     # Entity types card
-    if entity_types:
-        top_type = max(entity_types.keys(), key=lambda k: entity_types[k])
+    top_i = max(range(len(label_counts)), key=label_counts.__getitem__)
+    if label_counts[top_i] > 0:
         stats_cards.append(
             html.Div([
-                html.H4("🏷️ Top Label", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-                html.H2(str(entity_types[top_type]), style={'margin': '5px 0', 'color': '#2c3e50'}),
-                html.P(top_type, style={'margin': 0, 'fontSize': '12px', 'color': '#7f8c8d'})
-            ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
+                html.H4("🏷️ Top Label", style=STAT_TITLE_STYLE),
+                html.H2(str(label_counts[top_i]), style=STAT_VALUE_STYLE),
+                html.P(LABEL_TYPES[top_i], style=STAT_CAPTION_STYLE)
+            ], style=STAT_CARD_STYLE)
         )
     
     # User activity card
@@ -521,14 +876,32 @@ def update_statistics_dashboard(entities, history, current_index, texts_data):
         total_actions = sum(user_activity[most_active_user].values())
         stats_cards.append(
             html.Div([
-                html.H4("👤 Most Active", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-                html.H2(str(total_actions), style={'margin': '5px 0', 'color': '#2c3e50'}),
-                html.P(f"@{most_active_user}", style={'margin': 0, 'fontSize': '12px', 'color': '#7f8c8d'})
-            ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
+                html.H4("👤 Most Active", style=STAT_TITLE_STYLE),
+                html.H2(str(total_actions), style=STAT_VALUE_STYLE),
+                html.P(f"@{most_active_user}", style=STAT_CAPTION_STYLE)
+            ], style=STAT_CARD_STYLE)
         )
-    
+
     return stats_cards
 
+@callback(
+    Output('progress-stats', 'children'),
+    [Input('current-text-index', 'data'),
+     Input('texts-count', 'data')],
+    prevent_initial_call=True
+)
+def update_progress_stats(current_index, total_texts):
+    """Render the progress card from scalar inputs only"""
+    texts_completed = current_index if total_texts else 0
+    total_texts = total_texts or 0
+    progress_percentage = (texts_completed / total_texts * 100) if total_texts > 0 else 0
+
+    return html.Div([
+        html.H4("📊 Progress", style=STAT_TITLE_STYLE),
+        html.H2(f"{progress_percentage:.1f}%", style=STAT_VALUE_STYLE),
+        html.P(f"{texts_completed}/{total_texts} texts", style=STAT_CAPTION_STYLE)
+    ], style=STAT_CARD_STYLE)
+
 @callback(
     Output('export-display', 'children'),
     [Input('export-session-btn', 'n_clicks'),
@@ -537,9 +910,11 @@ def update_statistics_dashboard(entities, history, current_index, texts_data):
      State('ner-labeler', 'annotationHistory'),
      State('ner-labeler', 'currentUser'),
      State('session-id', 'data'),
-     State('texts-store', 'data')]
+     State('texts-store', 'data'),
+     State('stats-agg', 'data')],
+    prevent_initial_call=True
 )
-def handle_export_actions(export_clicks, audit_clicks, entities, history, current_user, session_id, texts_data):
+def handle_export_actions(export_clicks, audit_clicks, entities, history, current_user, session_id, texts_data, stats_agg):
     """Handle export and audit actions"""
     if not ctx.triggered:
         return ""
@@ -564,7 +939,7 @@ def handle_export_actions(export_clicks, audit_clicks, entities, history, curren
         
         return html.Div([
             html.H4("📋 Session Export", style={'marginBottom': '10px'}),
-            html.Pre(json.dumps(session_data, indent=2), style={
+            html.Pre(orjson.dumps(session_data, option=orjson.OPT_INDENT_2).decode(), style={
                 'backgroundColor': '#f8f9fa', 'border': '1px solid #ddd',
                 'borderRadius': '4px', 'padding': '15px', 'fontSize': '11px',
                 'maxHeight': '400px', 'overflowY': 'auto',
@@ -594,7 +969,9 @@ def handle_export_actions(export_clicks, audit_clicks, entities, history, curren
                         html.Small(entry.get('timestamp', ''), style={'color': '#7f8c8d'})
                     ], style={'padding': '8px', 'backgroundColor': 'white', 'border': '1px solid #e9ecef',
                              'borderRadius': '4px', 'marginBottom': '5px'})
-                    for entry in (history or [])[-10:]  # Show last 10 actions
+                    # Last 10 actions, kept by the stats fold in the
+                    # browser-side store so any worker can render them
+                    for entry in (stats_agg or {}).get('recent', [])
                 ])
             ])
         ])
@@ -605,6 +982,10 @@ def handle_export_actions(export_clicks, audit_clicks, entities, history, curren
 # RUN THE APPLICATION
 # ========================================
 
+# WSGI entry point for production servers:
+#   gunicorn -c gunicorn_conf.py bigquery_demo:server
+server = app.server
+
 if __name__ == '__main__':
     print("🚀 Starting BigQuery-Integrated NER Labeler...")
     print("📍 Visit: http://localhost:8053")
@@ -642,5 +1023,13 @@ if __name__ == '__main__':
     print("   5. Save to BigQuery (if connected)")
     print("   6. Export session data")
     print("-" * 60)
-    
-    app.run(debug=True, port=8053)
\ No newline at end of file
+
+    # The single-threaded debug server serializes every callback across all
+    # users; use it only for development (DASH_DEV=1). In production run
+    # gunicorn so uploads and prefetches overlap across requests.
+    if os.getenv('DASH_DEV'):
+        app.run(debug=True, port=8053)
+    else:
+        print("ℹ️ Set DASH_DEV=1 for the debug server, or run:")
+        print("   gunicorn -c gunicorn_conf.py bigquery_demo:server")
+        app.run(debug=False, port=8053)
\ No newline at end of file
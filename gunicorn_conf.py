@@ -0,0 +1,15 @@
+"""
+Gunicorn configuration for the BigQuery NER Labeler demo.
+
+Run with:
+    gunicorn -c gunicorn_conf.py bigquery_demo:server
+
+Threaded workers let blocking BigQuery reads overlap across requests,
+and multiple workers share reads through the flask-caching file cache.
+"""
+
+bind = "0.0.0.0:8053"
+workers = 4
+threads = 4
+worker_class = "gthread"
+timeout = 60
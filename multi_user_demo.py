@@ -22,17 +22,42 @@ License: MIT
 import dash
 from dash import html, dcc, callback, Input, Output, State, ALL
 import json
+from collections import Counter
 from datetime import datetime
 
+# Optional: orjson's C encoder makes the export serialization far cheaper
+# than the stdlib pretty-printer; fall back to json when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import the updated NER component
 from dash_ner_labeler import NERLabeler
 
+# Optional: gzip callback responses - the JSON export payload is highly
+# repetitive and compresses 5-10x on the wire
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 # Sample text for demonstration - contains various entity types
 SAMPLE_TEXT = """Apple Inc. is an American multinational technology company headquartered in Cupertino, California. Tim Cook is the current CEO of Apple. The company was founded by Steve Jobs, Steve Wozniak, and Ronald Wayne in April 1976 to develop and sell personal computers. Microsoft Corporation is another major technology company based in Redmond, Washington. Bill Gates and Paul Allen founded Microsoft in 1975. Both companies have had significant impact on the technology industry globally."""
 
 # Initialize the Dash app
 app = dash.Dash(__name__)
 app.title = "Multi-User NER Labeler Demo"
+if Compress:
+    app.server.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    Compress(app.server)
+
+# Shared styling for the statistics cards
+STAT_CARD_STYLE = {'backgroundColor': 'white', 'padding': '15px',
+                   'borderRadius': '8px', 'border': '1px solid #e9ecef'}
+STAT_CARD_HIDDEN_STYLE = {**STAT_CARD_STYLE, 'display': 'none'}
+STAT_TITLE_STYLE = {'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}
+STAT_VALUE_STYLE = {'margin': '5px 0', 'fontSize': '12px', 'color': '#2c3e50'}
 
 # ========================================
 # APP LAYOUT DEFINITION
@@ -72,10 +97,31 @@ app.layout = html.Div([
     
     html.Hr(style={'margin': '40px 0'}),
     
-    # Statistics section
+    # Statistics section. The card shells are static layout; callbacks
+    # update only the values inside them (and toggle the conditional
+    # cards), so each change reconciles a few text nodes instead of
+    # rebuilding the whole card grid.
     html.Div([
         html.H3("📊 Statistics:", style={'color': '#2c3e50', 'marginBottom': 15}),
-        html.Div(id='statistics-display', style={
+        html.Div([
+            html.Div([
+                html.H4("📝 Total Entities", style=STAT_TITLE_STYLE),
+                html.H2("0", id='stat-total', style={'margin': '5px 0', 'color': '#2c3e50'})
+            ], style=STAT_CARD_STYLE),
+            html.Div([
+                html.H4("🏷️ By Type", style=STAT_TITLE_STYLE),
+                html.P(id='stat-types', style=STAT_VALUE_STYLE)
+            ], id='stat-types-card', style=STAT_CARD_HIDDEN_STYLE),
+            html.Div([
+                html.H4("👥 Active Users", style=STAT_TITLE_STYLE),
+                html.P(id='stat-users', style=STAT_VALUE_STYLE)
+            ], id='stat-users-card', style=STAT_CARD_HIDDEN_STYLE),
+            html.Div([
+                html.H4("👤 Current User", style=STAT_TITLE_STYLE),
+                html.P("Not set", id='stat-current-user',
+                       style={'margin': '5px 0', 'fontSize': '14px', 'color': '#2c3e50', 'fontWeight': 'bold'})
+            ], style=STAT_CARD_STYLE),
+        ], id='statistics-display', style={
             'display': 'grid',
             'gridTemplateColumns': 'repeat(auto-fit, minmax(200px, 1fr))',
             'gap': '15px'
@@ -111,9 +157,14 @@ app.layout = html.Div([
 # CALLBACK FUNCTIONS
 # ========================================
 
-# Update statistics display
+# Update statistics values inside the static card shells
 @callback(
-    Output('statistics-display', 'children'),
+    [Output('stat-total', 'children'),
+     Output('stat-types', 'children'),
+     Output('stat-types-card', 'style'),
+     Output('stat-users', 'children'),
+     Output('stat-users-card', 'style'),
+     Output('stat-current-user', 'children')],
     [Input('ner-labeler', 'entities'),
      Input('ner-labeler', 'annotationHistory'),
      Input('ner-labeler', 'currentUser')]
@@ -121,69 +172,30 @@ app.layout = html.Div([
 def update_statistics(entities, history, current_user):
     """Display statistics about annotations and users."""
     entities = entities or []
-    history = history or []
-    
-    # Count entities by type
-    entity_counts = {}
-    for entity in entities:
-        label = entity['label']
-        entity_counts[label] = entity_counts.get(label, 0) + 1
-    
-    # Count entities by user
-    user_counts = {}
+
+    # Count entities by type and by user in a single pass
+    entity_counts = Counter()
+    user_counts = Counter()
     for entity in entities:
-        username = entity.get('username', 'Unknown')
-        user_counts[username] = user_counts.get(username, 0) + 1
-    
-    # Count actions by user
-    action_counts = {}
-    for entry in history:
-        username = entry.get('username', 'Unknown')
-        if username not in action_counts:
-            action_counts[username] = {'add': 0, 'remove': 0}
-        action_counts[username][entry['action']] += 1
-    
-    stats_cards = []
-    
-    # Total entities card
-    stats_cards.append(
-        html.Div([
-            html.H4("📝 Total Entities", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-            html.H2(str(len(entities)), style={'margin': '5px 0', 'color': '#2c3e50'})
-        ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
-    )
-    
-    # Entity types card
-    if entity_counts:
-        type_text = ", ".join([f"{label}: {count}" for label, count in entity_counts.items()])
-        stats_cards.append(
-            html.Div([
-                html.H4("🏷️ By Type", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-                html.P(type_text, style={'margin': '5px 0', 'fontSize': '12px', 'color': '#2c3e50'})
-            ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
-        )
-    
-    # Active users card
-    if user_counts:
-        user_text = ", ".join([f"@{user}: {count}" for user, count in user_counts.items()])
-        stats_cards.append(
-            html.Div([
-                html.H4("👥 Active Users", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-                html.P(user_text, style={'margin': '5px 0', 'fontSize': '12px', 'color': '#2c3e50'})
-            ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
-        )
-    
+        entity_counts[entity['label']] += 1
+        user_counts[entity.get('username', 'Unknown')] += 1
+
+    type_text = ", ".join([f"{label}: {count}" for label, count in entity_counts.items()])
+    user_text = ", ".join([f"@{user}: {count}" for user, count in user_counts.items()])
+
     # Current user card
     current_user_name = current_user.get('name') if current_user else 'Not set'
-    stats_cards.append(
-        html.Div([
-            html.H4("👤 Current User", style={'margin': 0, 'fontSize': '14px', 'color': '#6c757d'}),
-            html.P(f"@{current_user_name}" if current_user_name != 'Not set' else current_user_name, 
-                   style={'margin': '5px 0', 'fontSize': '14px', 'color': '#2c3e50', 'fontWeight': 'bold'})
-        ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '8px', 'border': '1px solid #e9ecef'})
+    current_user_text = (f"@{current_user_name}"
+                         if current_user_name != 'Not set' else current_user_name)
+
+    return (
+        str(len(entities)),
+        type_text,
+        STAT_CARD_STYLE if entity_counts else STAT_CARD_HIDDEN_STYLE,
+        user_text,
+        STAT_CARD_STYLE if user_counts else STAT_CARD_HIDDEN_STYLE,
+        current_user_text,
     )
-    
-    return stats_cards
 
 # Update JSON display with enhanced formatting
 @callback(
@@ -203,7 +215,11 @@ def update_json_display(entities, history, current_user):
         "total_entities": len(entities or []),
         "total_actions": len(history or [])
     }
-    return json.dumps(export_data, indent=2, ensure_ascii=False)
+    # orjson's C encoder keeps re-serializing SAMPLE_TEXT plus a growing
+    # history cheap; it emits UTF-8 directly, so no ensure_ascii handling
+    if orjson is not None:
+        return orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(export_data, indent=2)
 
 # Copy to clipboard functionality (client-side callback)
 app.clientside_callback(
@@ -16,11 +16,12 @@ Usage:
 """
 
 import argparse
-import json
+import orjson
 import sys
-import pandas as pd
-from datetime import datetime
-from bigquery_integration import BigQueryNERManager
+
+# pandas and the BigQuery manager are imported inside the functions that
+# need them: --create-config-only just writes a JSON file and shouldn't
+# pay for interpreter-startup of pandas/NumPy or the BigQuery client.
 
 def create_config_file(project_id: str, dataset_id: str = "ner_labeling", credentials_path: str = None):
     """Create BigQuery configuration file"""
@@ -38,8 +39,8 @@ def create_config_file(project_id: str, dataset_id: str = "ner_labeling", creden
     }
     
     config_file = "bigquery_config.json"
-    with open(config_file, "w") as f:
-        json.dump(config, f, indent=2)
+    with open(config_file, "wb") as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
     
     print(f"✅ Created configuration file: {config_file}")
     print(f"📝 Project ID: {project_id}")
@@ -51,100 +52,143 @@ def create_config_file(project_id: str, dataset_id: str = "ner_labeling", creden
         print("   2. Or run: gcloud auth application-default login")
         print("   3. Or update the config file with your service account key path")
 
-def create_sample_data(manager: BigQueryNERManager):
+# Fixed sample seed, built once at import. The metadata values are
+# pre-serialized JSON string literals - nothing is re-encoded per run.
+_SAMPLE_TEXTS = [
+    {
+        "text_id": "tech_001",
+        "text_content": "Apple Inc. announced that Tim Cook will continue as CEO through 2025. The Cupertino-based company reported record revenue of $394 billion in fiscal year 2022.",
+        "source": "tech_news",
+        "metadata": '{"category": "technology", "date": "2023-01-15"}',
+        "priority": 1
+    },
+    {
+        "text_id": "tech_002",
+        "text_content": "Microsoft Corporation's Azure cloud platform grew 40% year-over-year. CEO Satya Nadella highlighted the success during the quarterly earnings call from Redmond, Washington.",
+        "source": "earnings_reports",
+        "metadata": '{"category": "business", "date": "2023-02-10"}',
+        "priority": 2
+    },
+    {
+        "text_id": "tech_003",
+        "text_content": "Google's parent company Alphabet Inc. invested $10 billion in AI research in 2022. The Mountain View company is competing with OpenAI and other AI startups.",
+        "source": "ai_news",
+        "metadata": '{"category": "artificial_intelligence", "date": "2023-03-05"}',
+        "priority": 3
+    },
+    {
+        "text_id": "finance_001",
+        "text_content": "JPMorgan Chase reported net income of $37.7 billion in 2022. CEO Jamie Dimon praised the bank's resilient performance amid economic uncertainty.",
+        "source": "financial_reports", 
+        "metadata": '{"category": "finance", "date": "2023-01-20"}',
+        "priority": 2
+    },
+    {
+        "text_id": "healthcare_001",
+        "text_content": "Pfizer Inc. announced positive results from its Alzheimer's drug trial. The New York-based pharmaceutical company expects FDA approval by end of 2024.",
+        "source": "healthcare_news",
+        "metadata": '{"category": "healthcare", "date": "2023-04-12"}',
+        "priority": 1
+    },
+    {
+        "text_id": "sports_001",
+        "text_content": "The Los Angeles Lakers signed a new player development coach. LeBron James welcomed the addition, stating it will help young players in their training facility.",
+        "source": "sports_news",
+        "metadata": '{"category": "sports", "date": "2023-05-08"}',
+        "priority": 3
+    },
+    {
+        "text_id": "automotive_001", 
+        "text_content": "Tesla Inc. delivered over 1.3 million vehicles in 2022. Elon Musk announced plans to expand the Austin, Texas Gigafactory and hire 2,000 new employees.",
+        "source": "automotive_news",
+        "metadata": '{"category": "automotive", "date": "2023-01-03"}',
+        "priority": 2
+    },
+    {
+        "text_id": "retail_001",
+        "text_content": "Amazon.com Inc. reported strong holiday sales with $149.2 billion in revenue for Q4 2022. Andy Jassy noted improvements in their Seattle-based logistics network.",
+        "source": "retail_reports",
+        "metadata": '{"category": "retail", "date": "2023-02-02"}',
+        "priority": 1
+    }
+]
+
+def create_sample_data(manager: "BigQueryNERManager", use_load_job: bool = True):
     """Create sample text data for testing"""
-    sample_texts = pd.DataFrame([
-        {
-            "text_id": "tech_001",
-            "text_content": "Apple Inc. announced that Tim Cook will continue as CEO through 2025. The Cupertino-based company reported record revenue of $394 billion in fiscal year 2022.",
-            "source": "tech_news",
-            "metadata": json.dumps({"category": "technology", "date": "2023-01-15"}),
-            "priority": 1
-        },
-        {
-            "text_id": "tech_002",
-            "text_content": "Microsoft Corporation's Azure cloud platform grew 40% year-over-year. CEO Satya Nadella highlighted the success during the quarterly earnings call from Redmond, Washington.",
-            "source": "earnings_reports",
-            "metadata": json.dumps({"category": "business", "date": "2023-02-10"}),
-            "priority": 2
-        },
-        {
-            "text_id": "tech_003",
-            "text_content": "Google's parent company Alphabet Inc. invested $10 billion in AI research in 2022. The Mountain View company is competing with OpenAI and other AI startups.",
-            "source": "ai_news",
-            "metadata": json.dumps({"category": "artificial_intelligence", "date": "2023-03-05"}),
-            "priority": 3
-        },
-        {
-            "text_id": "finance_001",
-            "text_content": "JPMorgan Chase reported net income of $37.7 billion in 2022. CEO Jamie Dimon praised the bank's resilient performance amid economic uncertainty.",
-            "source": "financial_reports", 
-            "metadata": json.dumps({"category": "finance", "date": "2023-01-20"}),
-            "priority": 2
-        },
-        {
-            "text_id": "healthcare_001",
-            "text_content": "Pfizer Inc. announced positive results from its Alzheimer's drug trial. The New York-based pharmaceutical company expects FDA approval by end of 2024.",
-            "source": "healthcare_news",
-            "metadata": json.dumps({"category": "healthcare", "date": "2023-04-12"}),
-            "priority": 1
-        },
-        {
-            "text_id": "sports_001",
-            "text_content": "The Los Angeles Lakers signed a new player development coach. LeBron James welcomed the addition, stating it will help young players in their training facility.",
-            "source": "sports_news",
-            "metadata": json.dumps({"category": "sports", "date": "2023-05-08"}),
-            "priority": 3
-        },
-        {
-            "text_id": "automotive_001", 
-            "text_content": "Tesla Inc. delivered over 1.3 million vehicles in 2022. Elon Musk announced plans to expand the Austin, Texas Gigafactory and hire 2,000 new employees.",
-            "source": "automotive_news",
-            "metadata": json.dumps({"category": "automotive", "date": "2023-01-03"}),
-            "priority": 2
-        },
-        {
-            "text_id": "retail_001",
-            "text_content": "Amazon.com Inc. reported strong holiday sales with $149.2 billion in revenue for Q4 2022. Andy Jassy noted improvements in their Seattle-based logistics network.",
-            "source": "retail_reports",
-            "metadata": json.dumps({"category": "retail", "date": "2023-02-02"}),
-            "priority": 1
-        }
-    ])
-    
-    success = manager.bulk_upload_texts(sample_texts)
-    
+    # Shallow-copy the records: the upload path stamps created_at/status
+    # onto them and the module constant must stay pristine
+    sample_texts = [dict(record) for record in _SAMPLE_TEXTS]
+
+    # Larger seed files ship as a single load job - one payload, no
+    # per-row streaming inserts and no streaming quota. The small
+    # built-in sample stays on the manager's batch path.
+    if use_load_job and len(sample_texts) >= 500:
+        from google.cloud import bigquery
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition="WRITE_APPEND"
+        )
+        job = manager.client.load_table_from_json(
+            sample_texts, manager._t_texts, job_config=job_config)
+        job.result()
+        success = not job.errors
+    else:
+        success = manager.bulk_upload_texts_records(sample_texts)
+
     if success:
         print(f"✅ Created {len(sample_texts)} sample texts in BigQuery")
         print("📝 Sample texts include:")
-        for _, row in sample_texts.iterrows():
+        for row in sample_texts:
             print(f"   - {row['text_id']}: {row['text_content'][:50]}...")
     else:
         print("❌ Failed to create sample texts")
         
     return success
 
-def test_connection(project_id: str):
-    """Test BigQuery connection and display status"""
+def test_connection(project_id_or_manager):
+    """
+    Test BigQuery connection and display status
+
+    Accepts either a project ID string (standalone use) or an
+    already-initialized BigQueryNERManager - reusing main()'s manager
+    skips a second round of auth and dataset/table bootstrap.
+    """
     try:
-        print(f"🔌 Testing connection to {project_id}...")
-        
-        # Initialize manager
-        manager = BigQueryNERManager(project_id=project_id)
+        if isinstance(project_id_or_manager, str):
+            print(f"🔌 Testing connection to {project_id_or_manager}...")
+            from bigquery_integration import BigQueryNERManager
+            manager = BigQueryNERManager(project_id=project_id_or_manager)
+        else:
+            manager = project_id_or_manager
+            print(f"🔌 Testing connection to {manager.project_id}...")
         print("✅ BigQuery connection established")
-        
-        # Test loading texts
-        texts_df = manager.load_texts_for_annotation(limit=3)
-        print(f"✅ Successfully loaded {len(texts_df)} texts")
-        
-        # Test user statistics
-        stats = manager.get_user_statistics()
-        print(f"✅ Retrieved statistics for {stats['total_users']} users")
-        
-        # Test annotation history
-        history_df = manager.get_annotation_history()
-        print(f"✅ Retrieved {len(history_df)} history records")
-        
+
+        # The three probes are independent queries, so run them on a small
+        # thread pool: wall clock is the slowest probe instead of the sum
+        import concurrent.futures
+
+        probes = {
+            "texts": (lambda: manager.load_texts_for_annotation(limit=3),
+                      lambda r: f"✅ Successfully loaded {len(r)} texts"),
+            "stats": (manager.get_user_statistics,
+                      lambda r: f"✅ Retrieved statistics for {r['total_users']} users"),
+            "history": (manager.get_annotation_history,
+                        lambda r: f"✅ Retrieved {len(r)} history records"),
+        }
+
+        ok = True
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+            futures = {pool.submit(fn): report for fn, report in probes.values()}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    print(futures[future](future.result()))
+                except Exception as e:
+                    print(f"❌ Probe failed: {e}")
+                    ok = False
+
+        if not ok:
+            raise RuntimeError("one or more probe queries failed")
+
         print("🎉 All BigQuery operations working correctly!")
         return True
         
@@ -157,43 +201,47 @@ def test_connection(project_id: str):
         print("   4. Check IAM permissions")
         return False
 
-def create_sample_annotations(manager: BigQueryNERManager):
+# Fixed annotation seed, built once at import alongside _SAMPLE_TEXTS
+_SAMPLE_ANNOTATIONS = [
+    {
+        "text_id": "tech_001",
+        "entities": [
+            {"id": 1, "text": "Apple Inc.", "label": "ORGANIZATION", "start": 0, "end": 10},
+            {"id": 2, "text": "Tim Cook", "label": "PERSON", "start": 25, "end": 33},
+            {"id": 3, "text": "Cupertino", "label": "LOCATION", "start": 82, "end": 91},
+            {"id": 4, "text": "$394 billion", "label": "MONEY", "start": 125, "end": 137},
+            {"id": 5, "text": "fiscal year 2022", "label": "DATE", "start": 141, "end": 157}
+        ]
+    },
+    {
+        "text_id": "tech_002",
+        "entities": [
+            {"id": 1, "text": "Microsoft Corporation", "label": "ORGANIZATION", "start": 0, "end": 21},
+            {"id": 2, "text": "Azure", "label": "PRODUCT", "start": 24, "end": 29},
+            {"id": 3, "text": "Satya Nadella", "label": "PERSON", "start": 72, "end": 85},
+            {"id": 4, "text": "Redmond, Washington", "label": "LOCATION", "start": 144, "end": 163}
+        ]
+    }
+]
+
+def create_sample_annotations(manager: "BigQueryNERManager"):
     """Create sample annotations for testing"""
-    sample_annotations = [
-        {
-            "text_id": "tech_001",
-            "entities": [
-                {"id": 1, "text": "Apple Inc.", "label": "ORGANIZATION", "start": 0, "end": 10},
-                {"id": 2, "text": "Tim Cook", "label": "PERSON", "start": 25, "end": 33},
-                {"id": 3, "text": "Cupertino", "label": "LOCATION", "start": 82, "end": 91},
-                {"id": 4, "text": "$394 billion", "label": "MONEY", "start": 125, "end": 137},
-                {"id": 5, "text": "fiscal year 2022", "label": "DATE", "start": 141, "end": 157}
-            ]
-        },
-        {
-            "text_id": "tech_002", 
-            "entities": [
-                {"id": 1, "text": "Microsoft Corporation", "label": "ORGANIZATION", "start": 0, "end": 21},
-                {"id": 2, "text": "Azure", "label": "PRODUCT", "start": 24, "end": 29},
-                {"id": 3, "text": "Satya Nadella", "label": "PERSON", "start": 72, "end": 85},
-                {"id": 4, "text": "Redmond, Washington", "label": "LOCATION", "start": 144, "end": 163}
-            ]
-        }
-    ]
-    
-    for sample in sample_annotations:
-        success = manager.upload_annotations(
-            text_id=sample["text_id"],
-            entities=sample["entities"],
-            user_id="demo_user_001",
-            username="demo_annotator",
-            session_id="setup_session_001"
-        )
-        
-        if success:
-            print(f"✅ Created {len(sample['entities'])} sample annotations for {sample['text_id']}")
-        else:
-            print(f"❌ Failed to create annotations for {sample['text_id']}")
+
+    # One batched upload for every sample: a single insert per table
+    # instead of one streaming request per text_id
+    success = manager.upload_annotations_bulk(
+        _SAMPLE_ANNOTATIONS,
+        user_id="demo_user_001",
+        username="demo_annotator",
+        session_id="setup_session_001"
+    )
+
+    total_entities = sum(len(sample["entities"]) for sample in _SAMPLE_ANNOTATIONS)
+    if success:
+        print(f"✅ Created {total_entities} sample annotations across "
+              f"{len(_SAMPLE_ANNOTATIONS)} texts")
+    else:
+        print("❌ Failed to create sample annotations")
 
 def main():
     parser = argparse.ArgumentParser(description="Setup BigQuery integration for NER Labeler")
@@ -218,6 +266,7 @@ def main():
     
     try:
         # Initialize BigQuery manager
+        from bigquery_integration import BigQueryNERManager
         manager = BigQueryNERManager(
             project_id=args.project_id,
             dataset_id=args.dataset_id,
@@ -235,10 +284,10 @@ def main():
             print("\n🏷️ Creating sample annotations...")
             create_sample_annotations(manager)
         
-        # Test connection if requested
+        # Test connection if requested, reusing the manager initialized above
         if args.test_connection:
             print("\n🧪 Testing connection...")
-            test_connection(args.project_id)
+            test_connection(manager)
         
         print("\n🎉 Setup completed successfully!")
         print("🚀 You can now run: python bigquery_demo.py")
@@ -9,14 +9,24 @@ Tests the integration architecture, data structures, and API compatibility.
 
 import unittest
 import json
+import uuid
 import pandas as pd
+from collections import Counter
 from datetime import datetime
+
+# Copy-on-write keeps derived frames sharing unchanged blocks with their
+# source instead of cloning them
+pd.options.mode.copy_on_write = True
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
 
-# Add current directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add this file's directory to the path for imports. Plain dirname is
+# enough - no abspath resolution - and direct runs already have it as
+# sys.path[0], so the append only happens under test discovery.
+_HERE = os.path.dirname(__file__)
+if _HERE and _HERE not in sys.path:
+    sys.path.append(_HERE)
 
 try:
     from bigquery_integration import BigQueryNERManager
@@ -25,16 +35,41 @@ except ImportError as e:
     print(f"⚠️ BigQuery libraries not available: {e}")
     BIGQUERY_AVAILABLE = False
 
+# Required-field sets for BigQuery record shapes, built once at module
+# scope. Set difference checks all fields in one operation and reports
+# every missing field at once.
+_REQUIRED_TEXT_COLUMNS = frozenset({'text_id', 'text_content', 'source', 'metadata', 'priority'})
+_REQUIRED_ENTITY_FIELDS = frozenset({'id', 'text', 'label', 'start', 'end'})
+_REQUIRED_ANNOTATION_FIELDS = frozenset({
+    'annotation_id', 'text_id', 'entity_text', 'entity_label',
+    'start_position', 'end_position', 'user_id', 'username',
+    'created_at', 'updated_at', 'is_active'
+})
+_REQUIRED_HISTORY_FIELDS = frozenset({
+    'history_id', 'text_id', 'action', 'entity_data',
+    'user_id', 'username', 'timestamp'
+})
+_REQUIRED_SESSION_FIELDS = frozenset({
+    'session_id', 'user_id', 'username', 'start_time',
+    'last_activity', 'texts_annotated', 'total_annotations'
+})
+_REQUIRED_CONFIG_FIELDS = frozenset({'project_id', 'dataset_id', 'default_batch_size'})
+
 class TestBigQueryIntegration(unittest.TestCase):
     """Test BigQuery integration functionality"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.sample_project_id = "test-project-123"
-        self.sample_dataset_id = "test_ner_labeling"
-        
+    @classmethod
+    def setUpClass(cls):
+        """Build shared fixtures once for the whole class
+
+        Nothing here is mutated by the tests (test_batch_operations derives
+        a new frame via assign), so per-test setUp rebuilds were pure waste.
+        """
+        cls.sample_project_id = "test-project-123"
+        cls.sample_dataset_id = "test_ner_labeling"
+
         # Sample text data
-        self.sample_texts_df = pd.DataFrame([
+        cls.sample_texts_df = pd.DataFrame([
             {
                 "text_id": "test_001",
                 "text_content": "Apple Inc. is headquartered in Cupertino, California.",
@@ -52,7 +87,7 @@ class TestBigQueryIntegration(unittest.TestCase):
         ])
         
         # Sample entities
-        self.sample_entities = [
+        cls.sample_entities = [
             {
                 "id": 1,
                 "text": "Apple Inc.",
@@ -72,24 +107,22 @@ class TestBigQueryIntegration(unittest.TestCase):
         ]
         
         # Sample user info
-        self.sample_user_id = "test_user_123"
-        self.sample_username = "test_annotator"
-        self.sample_session_id = "session_456"
+        cls.sample_user_id = "test_user_123"
+        cls.sample_username = "test_annotator"
+        cls.sample_session_id = "session_456"
     
     def test_data_structures(self):
         """Test that data structures match BigQuery schema requirements"""
         print("🧪 Testing data structures...")
         
         # Test texts DataFrame structure
-        required_text_columns = ['text_id', 'text_content', 'source', 'metadata', 'priority']
-        for col in required_text_columns:
-            self.assertIn(col, self.sample_texts_df.columns, f"Missing column: {col}")
-        
+        missing = _REQUIRED_TEXT_COLUMNS - set(self.sample_texts_df.columns)
+        self.assertFalse(missing, f"Missing columns: {missing}")
+
         # Test entity structure
-        required_entity_fields = ['id', 'text', 'label', 'start', 'end']
         for entity in self.sample_entities:
-            for field in required_entity_fields:
-                self.assertIn(field, entity, f"Missing entity field: {field}")
+            missing = _REQUIRED_ENTITY_FIELDS - entity.keys()
+            self.assertFalse(missing, f"Missing entity fields: {missing}")
         
         # Test entity positions are valid
         for entity in self.sample_entities:
@@ -104,6 +137,10 @@ class TestBigQueryIntegration(unittest.TestCase):
         """Test annotation data format for BigQuery compatibility"""
         print("🧪 Testing annotation format...")
         
+        # One timestamp per batch: rows built together share it, mirroring
+        # how the manager stamps whole upload batches
+        now_iso = datetime.now().isoformat()
+
         # Create annotation record format
         annotation_record = {
             "annotation_id": f"test_001_{self.sample_entities[0]['id']}",
@@ -115,21 +152,15 @@ class TestBigQueryIntegration(unittest.TestCase):
             "confidence": self.sample_entities[0].get("confidence", 1.0),
             "user_id": self.sample_user_id,
             "username": self.sample_username,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "is_active": True,
             "metadata": json.dumps({})
         }
         
         # Test all required fields are present
-        required_fields = [
-            'annotation_id', 'text_id', 'entity_text', 'entity_label',
-            'start_position', 'end_position', 'user_id', 'username',
-            'created_at', 'updated_at', 'is_active'
-        ]
-        
-        for field in required_fields:
-            self.assertIn(field, annotation_record, f"Missing annotation field: {field}")
+        missing = _REQUIRED_ANNOTATION_FIELDS - annotation_record.keys()
+        self.assertFalse(missing, f"Missing annotation fields: {missing}")
         
         # Test data types
         self.assertIsInstance(annotation_record['start_position'], int)
@@ -143,9 +174,10 @@ class TestBigQueryIntegration(unittest.TestCase):
         """Test annotation history format"""
         print("🧪 Testing history format...")
         
-        # Create history record format
+        # uuid4 rather than a timestamp-derived id: no collision when two
+        # records land in the same microsecond during a bulk insert
         history_record = {
-            "history_id": f"hist_{datetime.now().timestamp()}",
+            "history_id": f"hist_{uuid.uuid4().hex}",
             "annotation_id": f"test_001_{self.sample_entities[0]['id']}",
             "text_id": "test_001",
             "action": "create",
@@ -158,13 +190,8 @@ class TestBigQueryIntegration(unittest.TestCase):
         }
         
         # Test required fields
-        required_fields = [
-            'history_id', 'text_id', 'action', 'entity_data',
-            'user_id', 'username', 'timestamp'
-        ]
-        
-        for field in required_fields:
-            self.assertIn(field, history_record, f"Missing history field: {field}")
+        missing = _REQUIRED_HISTORY_FIELDS - history_record.keys()
+        self.assertFalse(missing, f"Missing history fields: {missing}")
         
         # Test action is valid
         self.assertIn(history_record['action'], ['create', 'update', 'delete'])
@@ -179,25 +206,21 @@ class TestBigQueryIntegration(unittest.TestCase):
         """Test user session format"""
         print("🧪 Testing user session format...")
         
+        now_iso = datetime.now().isoformat()
         session_record = {
             "session_id": self.sample_session_id,
             "user_id": self.sample_user_id,
             "username": self.sample_username,
-            "start_time": datetime.now().isoformat(),
-            "last_activity": datetime.now().isoformat(),
+            "start_time": now_iso,
+            "last_activity": now_iso,
             "end_time": None,
             "texts_annotated": 2,
             "total_annotations": 5,
             "session_metadata": json.dumps({"client": "web_interface"})
         }
         
-        required_fields = [
-            'session_id', 'user_id', 'username', 'start_time',
-            'last_activity', 'texts_annotated', 'total_annotations'
-        ]
-        
-        for field in required_fields:
-            self.assertIn(field, session_record, f"Missing session field: {field}")
+        missing = _REQUIRED_SESSION_FIELDS - session_record.keys()
+        self.assertFalse(missing, f"Missing session fields: {missing}")
         
         # Test data types
         self.assertIsInstance(session_record['texts_annotated'], int)
@@ -250,9 +273,8 @@ class TestBigQueryIntegration(unittest.TestCase):
         }
         
         # Validate configuration fields
-        required_fields = ['project_id', 'dataset_id', 'default_batch_size']
-        for field in required_fields:
-            self.assertIn(field, config, f"Missing config field: {field}")
+        missing = _REQUIRED_CONFIG_FIELDS - config.keys()
+        self.assertFalse(missing, f"Missing config fields: {missing}")
         
         # Test JSON serialization
         config_json = json.dumps(config, indent=2)
@@ -265,11 +287,12 @@ class TestBigQueryIntegration(unittest.TestCase):
         """Test batch operation data preparation"""
         print("🧪 Testing batch operations...")
         
-        # Test text batch preparation
-        texts_for_upload = self.sample_texts_df.copy()
-        texts_for_upload["created_at"] = datetime.now().isoformat()
-        texts_for_upload["status"] = "pending"
-        
+        # Test text batch preparation. assign() adds the two scalar columns
+        # without cloning the source frame's data blocks.
+        now_iso = datetime.now().isoformat()
+        texts_for_upload = self.sample_texts_df.assign(
+            created_at=now_iso, status="pending")
+
         # Convert to records for BigQuery insertion
         records = texts_for_upload.to_dict("records")
         
@@ -297,17 +320,11 @@ class TestBigQueryIntegration(unittest.TestCase):
             {"user_id": "user1", "username": "alice", "entity_label": "LOCATION", "text_id": "text2"},
         ]
         
-        # Calculate statistics manually for validation
-        user_counts = {}
-        label_counts = {}
-        
-        for annotation in sample_annotations:
-            username = annotation["username"]
-            label = annotation["entity_label"]
-            
-            user_counts[username] = user_counts.get(username, 0) + 1
-            label_counts[label] = label_counts.get(label, 0) + 1
-        
+        # Counter's C fast path does one probe per increment, and skips
+        # the DataFrame construction a groupby would need
+        user_counts = Counter(a["username"] for a in sample_annotations)
+        label_counts = Counter(a["entity_label"] for a in sample_annotations)
+
         # Validate calculations
         self.assertEqual(user_counts["alice"], 3)
         self.assertEqual(user_counts["bob"], 1)
@@ -324,17 +341,18 @@ class TestBigQueryIntegration(unittest.TestCase):
         from bigquery_demo import create_demo_texts
         
         demo_texts = create_demo_texts()
-        
-        # Validate demo data structure
-        self.assertIsInstance(demo_texts, pd.DataFrame)
+
+        # Validate demo data structure - plain record dicts, one per text
+        self.assertIsInstance(demo_texts, list)
         self.assertGreater(len(demo_texts), 0)
-        
-        required_columns = ['text_id', 'text_content', 'source', 'status', 'priority']
-        for col in required_columns:
-            self.assertIn(col, demo_texts.columns)
-        
+
+        required_fields = ['text_id', 'text_content', 'source', 'status', 'priority']
+
         # Check data quality
-        for _, row in demo_texts.iterrows():
+        for row in demo_texts:
+            self.assertIsInstance(row, dict)
+            for field in required_fields:
+                self.assertIn(field, row)
             self.assertIsInstance(row['text_id'], str)
             self.assertIsInstance(row['text_content'], str)
             self.assertGreater(len(row['text_content']), 10)  # Meaningful content
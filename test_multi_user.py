@@ -11,8 +11,23 @@ This script tests the enhanced NER labeler component with multi-user features:
 
 from dash_ner_labeler import NERLabeler
 import json
+import pandas as pd
 from datetime import datetime
 
+# Optional: orjson's C encoder makes the export round-trip far cheaper
+# than the stdlib pretty-printer; fall back to json when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Multi-user properties the component must expose, built once at module
+# scope so the check is a single hash-based set difference
+_EXPECTED_PROPS = frozenset({
+    'id', 'text', 'entities', 'labelTypes', 'currentUser',
+    'annotationHistory', 'showUserInfo', 'showHistory'
+})
+
 def test_component_properties():
     """Test that the component has all required multi-user properties"""
     print("🧪 Testing NERLabeler component properties...")
@@ -30,16 +45,10 @@ def test_component_properties():
     )
     
     # Check that all properties are available
-    expected_props = ['id', 'text', 'entities', 'labelTypes', 'currentUser', 
-                     'annotationHistory', 'showUserInfo', 'showHistory']
-    
-    actual_props = component.available_properties
-    
-    for prop in expected_props:
-        assert prop in actual_props, f"Missing property: {prop}"
-    
+    missing = _EXPECTED_PROPS - set(component.available_properties)
+    assert not missing, f"Missing properties: {missing}"
+
     print("✅ All component properties are available")
-    return True
 
 def test_entity_structure():
     """Test the enhanced entity structure with user tracking"""
@@ -57,15 +66,15 @@ def test_entity_structure():
         'timestamp': datetime.now().isoformat()
     }
     
-    # Test required fields
-    required_fields = ['id', 'text', 'label', 'start', 'end']
-    user_fields = ['user_id', 'username', 'timestamp']
-    
-    for field in required_fields + user_fields:
-        assert field in sample_entity, f"Missing field: {field}"
+    # Test required fields - one set difference reports every missing
+    # field at once instead of one membership probe per field
+    required_fields = {'id', 'text', 'label', 'start', 'end'}
+    user_fields = {'user_id', 'username', 'timestamp'}
+
+    missing = (required_fields | user_fields) - sample_entity.keys()
+    assert not missing, f"Missing fields: {missing}"
     
     print("✅ Entity structure supports user tracking")
-    return True
 
 def test_annotation_history_structure():
     """Test the annotation history structure"""
@@ -88,106 +97,64 @@ def test_annotation_history_structure():
     }
     
     # Test required fields
-    required_fields = ['id', 'action', 'entity', 'user_id', 'username', 'timestamp']
-    
-    for field in required_fields:
-        assert field in sample_history, f"Missing field: {field}"
+    required_fields = {'id', 'action', 'entity', 'user_id', 'username', 'timestamp'}
+
+    missing = required_fields - sample_history.keys()
+    assert not missing, f"Missing fields: {missing}"
     
     # Test action values
     assert sample_history['action'] in ['add', 'remove'], f"Invalid action: {sample_history['action']}"
     
     print("✅ Annotation history structure is correct")
-    return True
+
+# Field orders for the scenario fixtures. Records are built with
+# dict(zip(KEYS, row)) - one C call per row instead of a parsed dict
+# literal, which keeps fixture construction flat when this scaffold is
+# scaled up to thousands of annotations.
+_ENTITY_KEYS = ('id', 'text', 'label', 'start', 'end', 'user_id', 'username', 'timestamp')
+_HISTORY_KEYS = ('id', 'action', 'entity', 'user_id', 'username', 'timestamp')
 
 def test_multi_user_scenario():
     """Test a realistic multi-user annotation scenario"""
     print("🧪 Testing multi-user annotation scenario...")
-    
+
     # Simulate multiple users annotating the same text
     text = "Tim Cook is the CEO of Apple Inc. in Cupertino, California."
-    
+
     # User 1 annotations
-    user1_entities = [
-        {
-            'id': 1001,
-            'text': 'Tim Cook',
-            'label': 'PERSON',
-            'start': 0,
-            'end': 8,
-            'user_id': 'user1',
-            'username': 'alice',
-            'timestamp': '2024-01-01T10:00:00Z'
-        },
-        {
-            'id': 1002,
-            'text': 'Apple Inc.',
-            'label': 'ORGANIZATION',
-            'start': 25,
-            'end': 35,
-            'user_id': 'user1',
-            'username': 'alice',
-            'timestamp': '2024-01-01T10:01:00Z'
-        }
-    ]
-    
+    user1_entities = [dict(zip(_ENTITY_KEYS, row)) for row in [
+        (1001, 'Tim Cook', 'PERSON', 0, 8, 'user1', 'alice', '2024-01-01T10:00:00Z'),
+        (1002, 'Apple Inc.', 'ORGANIZATION', 25, 35, 'user1', 'alice', '2024-01-01T10:01:00Z'),
+    ]]
+
     # User 2 annotations
-    user2_entities = [
-        {
-            'id': 2001,
-            'text': 'Cupertino, California',
-            'label': 'LOCATION',
-            'start': 39,
-            'end': 60,
-            'user_id': 'user2',
-            'username': 'bob',
-            'timestamp': '2024-01-01T10:30:00Z'
-        }
-    ]
-    
+    user2_entities = [dict(zip(_ENTITY_KEYS, row)) for row in [
+        (2001, 'Cupertino, California', 'LOCATION', 39, 60, 'user2', 'bob', '2024-01-01T10:30:00Z'),
+    ]]
+
     # Combined entities from both users
     all_entities = user1_entities + user2_entities
-    
+
     # Annotation history
-    history = [
-        {
-            'id': 'h1',
-            'action': 'add',
-            'entity': user1_entities[0],
-            'user_id': 'user1',
-            'username': 'alice',
-            'timestamp': '2024-01-01T10:00:00Z'
-        },
-        {
-            'id': 'h2',
-            'action': 'add',
-            'entity': user1_entities[1],
-            'user_id': 'user1',
-            'username': 'alice',
-            'timestamp': '2024-01-01T10:01:00Z'
-        },
-        {
-            'id': 'h3',
-            'action': 'add',
-            'entity': user2_entities[0],
-            'user_id': 'user2',
-            'username': 'bob',
-            'timestamp': '2024-01-01T10:30:00Z'
-        }
-    ]
+    history = [dict(zip(_HISTORY_KEYS, row)) for row in [
+        ('h1', 'add', user1_entities[0], 'user1', 'alice', '2024-01-01T10:00:00Z'),
+        ('h2', 'add', user1_entities[1], 'user1', 'alice', '2024-01-01T10:01:00Z'),
+        ('h3', 'add', user2_entities[0], 'user2', 'bob', '2024-01-01T10:30:00Z'),
+    ]]
     
     # Validate the scenario
     assert len(all_entities) == 3, f"Expected 3 entities, got {len(all_entities)}"
     assert len(history) == 3, f"Expected 3 history entries, got {len(history)}"
     
-    # Check user distribution
-    user1_count = sum(1 for e in all_entities if e['username'] == 'alice')
-    user2_count = sum(1 for e in all_entities if e['username'] == 'bob')
-    
-    assert user1_count == 2, f"Expected 2 entities from alice, got {user1_count}"
-    assert user2_count == 1, f"Expected 1 entity from bob, got {user2_count}"
+    # Check user distribution. Columnar layout plus a C-level groupby
+    # keeps this scaffold usable when the fixture grows to thousands of
+    # annotations; at that size per-dict Python loops dominate.
+    user_counts = pd.DataFrame(all_entities).groupby('username').size()
+
+    assert user_counts['alice'] == 2, f"Expected 2 entities from alice, got {user_counts['alice']}"
+    assert user_counts['bob'] == 1, f"Expected 1 entity from bob, got {user_counts['bob']}"
     
     print("✅ Multi-user scenario validation passed")
-    return True
 
 def test_json_export():
     """Test JSON export with multi-user data"""
@@ -223,11 +190,11 @@ def test_json_export():
         "total_actions": 1
     }
     
-    # Test JSON serialization
-    json_str = json.dumps(export_data, indent=2)
-    
-    # Test JSON deserialization
-    parsed_data = json.loads(json_str)
+    # Test JSON serialization and deserialization round-trip
+    if orjson is not None:
+        parsed_data = orjson.loads(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+    else:
+        parsed_data = json.loads(json.dumps(export_data, indent=2))
     
     assert parsed_data['total_entities'] == 1
     assert parsed_data['total_actions'] == 1
@@ -235,45 +202,13 @@ def test_json_export():
     assert len(parsed_data['annotation_history']) == 1
     
     print("✅ JSON export/import works correctly")
-    return True
-
-def run_all_tests():
-    """Run all tests and report results"""
-    print("🧪 Running Multi-User NER Labeler Tests")
-    print("=" * 50)
-    
-    tests = [
-        test_component_properties,
-        test_entity_structure,
-        test_annotation_history_structure,
-        test_multi_user_scenario,
-        test_json_export
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-                print(f"❌ {test.__name__} failed")
-        except Exception as e:
-            failed += 1
-            print(f"❌ {test.__name__} failed with error: {e}")
-    
-    print("=" * 50)
-    print(f"📊 Test Results: {passed} passed, {failed} failed")
-    
-    if failed == 0:
-        print("🎉 All tests passed! Multi-user functionality is working correctly.")
-        return True
-    else:
-        print("⚠️ Some tests failed. Please check the implementation.")
-        return False
 
 if __name__ == "__main__":
-    success = run_all_tests()
-    exit(0 if success else 1)
\ No newline at end of file
+    import sys
+
+    import pytest
+
+    # pytest discovers the test_* functions itself, replacing the manual
+    # try/except orchestration loop; with pytest-xdist installed the
+    # tests additionally spread across cores via "-n auto"
+    sys.exit(pytest.main([__file__, "-v"]))
\ No newline at end of file
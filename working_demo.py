@@ -17,120 +17,27 @@ License: MIT
 """
 
 import dash
-from dash import html, dcc, callback, Input, Output, State, clientside_callback
-import json
+from dash import html, dcc, Input, Output
 
-# Sample text for demonstration - contains various entity types
-SAMPLE_TEXT = """Apple Inc. is an American multinational technology company headquartered in Cupertino, California. Tim Cook is the current CEO of Apple. The company was founded by Steve Jobs, Steve Wozniak, and Ronald Wayne in April 1976."""
+# Optional: gzip callback responses - indented JSON compresses 5-10x
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# The sample text lives in assets/sample.txt: Flask serves it as a
+# cacheable static file and a clientside callback below turns it into
+# offset-annotated spans, so the text never inflates the layout JSON
 
 # Initialize the Dash app
 app = dash.Dash(__name__)
+if Compress:
+    app.server.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    Compress(app.server)
 
-# Custom HTML template with embedded CSS and JavaScript
-# This approach embeds all styling and JavaScript directly in the HTML for simplicity
-app.index_string = '''
-<!DOCTYPE html>
-<html>
-    <head>
-        {%metas%}
-        <title>{%title%}</title>
-        {%favicon%}
-        {%css%}
-        <style>
-            /* === NER LABELER STYLES === */
-            /* Main text container where users select text */
-            .ner-text-container {
-                background-color: #f8f9fa;   /* Light gray background */
-                border: 1px solid #dee2e6;   /* Subtle border */
-                border-radius: 6px;          /* Rounded corners */
-                padding: 20px;               /* Internal spacing */
-                line-height: 1.6;            /* Readable line spacing */
-                font-size: 16px;             /* Comfortable reading size */
-                min-height: 200px;           /* Minimum height for text area */
-                cursor: text;                /* Text cursor on hover */
-                position: relative;          /* For absolute positioning of children */
-                user-select: text;           /* Allow text selection */
-            }
-            
-            /* Highlighted entity spans - currently unused but ready for future implementation */
-            .ner-entity {
-                position: relative;
-                padding: 2px 4px;
-                margin: 0 1px;
-                border-radius: 3px;
-                cursor: pointer;
-                display: inline;
-                transition: all 0.2s ease;
-            }
-            .ner-entity:hover {
-                opacity: 0.8;
-            }
-            
-            /* Entity type color schemes */
-            .ner-person { background-color: #ffeb3b; border: 1px solid #fbc02d; }               /* Yellow */
-            .ner-organization { background-color: #2196f3; color: white; border: 1px solid #1976d2; } /* Blue */
-            .ner-location { background-color: #4caf50; color: white; border: 1px solid #388e3c; }     /* Green */
-            .ner-miscellaneous { background-color: #ff9800; color: white; border: 1px solid #f57c00; } /* Orange */
-            
-            .ner-label-modal {
-                position: absolute;
-                background: white;
-                border: 1px solid #ccc;
-                border-radius: 6px;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-                z-index: 1000;
-                display: none;
-            }
-            .ner-modal-content {
-                padding: 15px;
-                min-width: 200px;
-            }
-            .ner-label-btn {
-                display: block;
-                width: 100%;
-                padding: 8px 12px;
-                margin: 4px 0;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background: white;
-                cursor: pointer;
-                font-size: 13px;
-            }
-            .ner-label-btn:hover { background-color: #f5f5f5; }
-            .ner-cancel-btn {
-                display: block;
-                width: 100%;
-                padding: 8px 12px;
-                margin: 8px 0 0 0;
-                border: 1px solid #dc3545;
-                border-radius: 4px;
-                background: white;
-                color: #dc3545;
-                cursor: pointer;
-                font-size: 13px;
-            }
-        </style>
-    </head>
-    <body>
-        {%app_entry%}
-        <footer>
-            {%config%}
-            {%scripts%}
-            {%renderer%}
-        </footer>
-        <script>
-            /* Placeholder for future clientside JavaScript functionality */
-            window.dash_clientside = Object.assign({}, window.dash_clientside, {
-                clientside: {
-                    handleTextSelection: function(n_clicks) {
-                        return window.dash_clientside.no_update;
-                    }
-                }
-            });
-        </script>
-    </body>
-</html>
-'''
+# Styling and the clientside placeholder live in assets/ - Dash picks
+# them up automatically and Flask serves them as static files with
+# cache headers, instead of re-templating an inline blob per request
 
 # ========================================
 # APP LAYOUT DEFINITION
@@ -154,25 +61,33 @@ app.layout = html.Div([
     html.Div([
         html.Div(
             id='text-display',
-            children=SAMPLE_TEXT,
+            children=[],
             className='ner-text-container'
         ),
         
         # Label buttons
+        # Each button carries its label in data-label; a single delegated
+        # listener in assets/ner.js handles all of them, so there are no
+        # per-button n_clicks subscriptions in the renderer
         html.Div([
             html.H4("Label Selected Text:"),
-            html.Button('PERSON', id='btn-person', className='ner-label-btn', 
-                       style={'backgroundColor': '#ffeb3b', 'margin': '5px'}),
+            html.Button('PERSON', id='btn-person', className='ner-label-btn',
+                       style={'backgroundColor': '#ffeb3b', 'margin': '5px'},
+                       **{'data-label': 'PERSON'}),
             html.Button('ORGANIZATION', id='btn-org', className='ner-label-btn',
-                       style={'backgroundColor': '#2196f3', 'color': 'white', 'margin': '5px'}),
+                       style={'backgroundColor': '#2196f3', 'color': 'white', 'margin': '5px'},
+                       **{'data-label': 'ORGANIZATION'}),
             html.Button('LOCATION', id='btn-loc', className='ner-label-btn',
-                       style={'backgroundColor': '#4caf50', 'color': 'white', 'margin': '5px'}),
+                       style={'backgroundColor': '#4caf50', 'color': 'white', 'margin': '5px'},
+                       **{'data-label': 'LOCATION'}),
             html.Button('MISCELLANEOUS', id='btn-misc', className='ner-label-btn',
-                       style={'backgroundColor': '#ff9800', 'color': 'white', 'margin': '5px'}),
+                       style={'backgroundColor': '#ff9800', 'color': 'white', 'margin': '5px'},
+                       **{'data-label': 'MISCELLANEOUS'}),
         ], style={'marginTop': 20, 'textAlign': 'center'}),
         
-        # Hidden data store to persist entity list across callbacks
-        dcc.Store(id='entities-store', data=[]),
+        # Hidden data store to persist entities across callbacks, keyed
+        # by entity id so removal is a single delete rather than a scan
+        dcc.Store(id='entities-store', data={}),
         
         # Feedback area to show user what text was selected/labeled
         html.Div(id='selection-info', style={'marginTop': 20}),
@@ -180,16 +95,23 @@ app.layout = html.Div([
     
     html.Hr(style={'margin': '40px 0'}),
     
-    # Results display section
+    # Results display section. The list scrolls inside a fixed-height
+    # container so large annotation sets don't stretch the page, and the
+    # cards use content-visibility so the browser only renders the
+    # visible window of them.
     html.Div([
         html.H3("Labeled Entities:"),
-        html.Div(id='entities-display')  # Dynamic list of entities with remove buttons
+        # The empty-store state is baked into the layout so first paint
+        # is correct without scheduling the render callback at all
+        html.Div(id='entities-display',
+                 children=html.P('No entities labeled yet.'),
+                 style={'maxHeight': '400px', 'overflowY': 'auto'})
     ]),
-    
+
     # JSON export section for ML training data
     html.Div([
         html.H3("JSON Output:"),
-        html.Pre(id='entities-json', style={
+        html.Pre(id='entities-json', children='[]', style={
             'backgroundColor': '#f8f9fa',
             'border': '1px solid #ddd', 
             'borderRadius': 4,
@@ -203,220 +125,116 @@ app.layout = html.Div([
 # CALLBACK FUNCTIONS
 # ========================================
 
-# Main text selection and labeling callback (runs in browser)
-# This handles all the core NER functionality using JavaScript
+# One-time text bootstrap (runs in browser)
+# Fetches the sample text from the static asset and splits it into word
+# spans that each carry their absolute start offset. Serving the text as
+# an asset keeps it (and one span component per word) out of the initial
+# /_dash-layout payload; the data-offset index is what lets the labeling
+# callback resolve selection positions in constant time.
 app.clientside_callback(
     """
-    function(person_clicks, org_clicks, loc_clicks, misc_clicks, current_entities) {
-        // === TEXT SELECTION AND LABELING LOGIC ===
-        // This function runs in the browser and handles all text selection/labeling
-        
-        const ctx = window.dash_clientside.callback_context;
-        
-        // Check if any button was actually clicked
-        if (!ctx.triggered.length) {
-            return [current_entities, 'Select some text and click a label button'];
-        }
-        
-        // Map button IDs to entity label types
-        const button_id = ctx.triggered[0].prop_id.split('.')[0];
-        const label_map = {
-            'btn-person': 'PERSON',
-            'btn-org': 'ORGANIZATION', 
-            'btn-loc': 'LOCATION',
-            'btn-misc': 'MISCELLANEOUS'
-        };
-        
-        const label = label_map[button_id];
-        if (!label) {
-            return [current_entities, 'No label selected'];
-        }
-        
-        // Get the user's text selection using browser Selection API
-        const selection = window.getSelection();
-        if (selection.rangeCount === 0 || selection.toString().trim() === '') {
-            return [current_entities, 'No text selected'];
-        }
-        
-        const selectedText = selection.toString().trim();
-        const range = selection.getRangeAt(0);
-        
-        // Calculate character position within the text container
-        // This is a simplified approach that works for this demo
-        const textContainer = document.getElementById('text-display');
-        const beforeRange = document.createRange();
-        beforeRange.setStart(textContainer, 0);
-        beforeRange.setEnd(range.startContainer, range.startOffset);
-        const start = beforeRange.toString().length;
-        
-        // Create new entity object for the labeled text
-        const newEntity = {
-            id: Date.now() + Math.random(),  // Unique ID using timestamp + random
-            text: selectedText,
-            label: label,
-            start: start,
-            end: start + selectedText.length
-        };
-        
-        // Add to existing entities list
-        const updatedEntities = [...current_entities, newEntity];
-        
-        // Clear the text selection to provide visual feedback
-        selection.removeAllRanges();
-        
-        // Return updated data and user feedback message
-        return [updatedEntities, `Labeled "${selectedText}" as ${label}`];
+    function(_) {
+        return fetch('assets/sample.txt')
+            .then(resp => resp.text())
+            .then(text => {
+                const spans = [];
+                let offset = 0;
+                for (const token of text.split(/(\\s+)/)) {
+                    if (!token) continue;
+                    spans.push({
+                        namespace: 'dash_html_components',
+                        type: 'Span',
+                        props: {children: token, 'data-offset': String(offset)}
+                    });
+                    offset += token.length;
+                }
+                return spans;
+            });
     }
     """,
-    [Output('entities-store', 'data'),
-     Output('selection-info', 'children')],
-    [Input('btn-person', 'n_clicks'),
-     Input('btn-org', 'n_clicks'), 
-     Input('btn-loc', 'n_clicks'),
-     Input('btn-misc', 'n_clicks')],
-    [State('entities-store', 'data')],
-    prevent_initial_call=True
+    Output('text-display', 'children'),
+    Input('text-display', 'id')
 )
 
-# Simple callback to update JSON display whenever entities change
-@callback(
-    Output('entities-json', 'children'),
-    [Input('entities-store', 'data')]
-)
-def update_json_display(entities):
-    """Convert entities list to formatted JSON for display and export."""
-    return json.dumps(entities, indent=2)
-
-# Main callback to render the entities list with remove buttons
-@callback(
-    Output('entities-display', 'children'),
-    [Input('entities-store', 'data')]
-)
-def display_entities(entities):
-    """
-    Create visual cards for each labeled entity with remove functionality.
-    
-    Args:
-        entities: List of entity dictionaries from the data store
-        
-    Returns:
-        List of HTML Div components representing entity cards
+# Text selection and labeling is handled by a single delegated click
+# listener in assets/ner.js: the label buttons carry their label in
+# data-label, so one listener covers all of them with no per-button
+# n_clicks subscription in the renderer and no prop_id-parsing switch.
+# The listener builds the entity from the current selection and pushes
+# the updated map into entities-store via dash_clientside.set_props.
+
+# Entity-card and JSON-preview rendering callback (runs in browser)
+# Building both views clientside keeps entity changes off the Python
+# server, and fusing them into one multi-output callback means each
+# store change schedules a single render pass instead of two. The
+# remove buttons get the same pattern-matching ids the Python version
+# produced, so the remove_entity callback below is unchanged.
+app.clientside_callback(
     """
-    if not entities:
-        return html.P("No entities labeled yet.")
-    
-    entity_cards = []
-    for entity in entities:
-        # Color scheme for different entity types
-        color_map = {
-            'PERSON': '#ffeb3b',        # Yellow
-            'ORGANIZATION': '#2196f3',  # Blue
-            'LOCATION': '#4caf50',      # Green
-            'MISCELLANEOUS': '#ff9800'  # Orange
+    function(entities) {
+        const h = (type, props) => ({namespace: 'dash_html_components', type: type, props: props});
+        // Entities are immutable once created, so the key set is a full
+        // signature of the store; when a trigger delivers the same set
+        // (double-click, idempotent removal), skip the stringify and
+        // re-render entirely
+        const keys = entities ? Object.keys(entities).join() : '';
+        if (keys === window.__nerLastKeys) {
+            return [window.dash_clientside.no_update,
+                    window.dash_clientside.no_update];
         }
-        
-        # Adjust text color for readability (yellow background needs black text)
-        text_color = 'black' if entity['label'] == 'PERSON' else 'white'
-        bg_color = color_map.get(entity['label'], '#6c757d')  # Default to gray
-        
-        card = html.Div([
-            html.Span(
-                entity['label'],
-                style={
-                    'backgroundColor': bg_color,
-                    'color': text_color,
-                    'padding': '4px 8px',
-                    'borderRadius': '12px',
-                    'fontSize': '11px',
-                    'fontWeight': 'bold',
-                    'marginRight': '10px'
-                }
-            ),
-            html.Span(f'"{entity["text"]}"', style={'fontWeight': 'bold', 'flex': '1'}),
-            html.Span(f" (position {entity['start']}-{entity['end']})",
-                     style={'color': '#6c757d', 'fontSize': '12px', 'marginRight': '10px'}),
-            html.Button(
-                '×',
-                id={'type': 'remove-entity', 'index': entity['id']},
-                style={
-                    'background': '#dc3545',
-                    'color': 'white',
-                    'border': 'none',
-                    'borderRadius': '50%',
-                    'width': '25px',
-                    'height': '25px',
-                    'cursor': 'pointer',
-                    'fontSize': '16px',
-                    'display': 'flex',
-                    'alignItems': 'center',
-                    'justifyContent': 'center',
-                    'lineHeight': '1'
-                },
-                title='Remove entity'
-            )
-        ], style={
-            'display': 'flex',
-            'alignItems': 'center', 
-            'backgroundColor': 'white',
-            'border': '1px solid #dee2e6',
-            'borderRadius': '8px',
-            'padding': '12px',
-            'marginBottom': '8px'
-        })
-        entity_cards.append(card)
-    
-    return html.Div(entity_cards)
-
-# Pattern-matching callback to handle entity removal
-# Uses Dash's pattern-matching callback feature to handle dynamic remove buttons
-@callback(
-    Output('entities-store', 'data', allow_duplicate=True),
-    Input({'type': 'remove-entity', 'index': dash.dependencies.ALL}, 'n_clicks'),
-    State('entities-store', 'data'),
+        window.__nerLastKeys = keys;
+        const entityList = entities ? Object.values(entities) : [];
+        // Mirror the store for the delegated remove listener in
+        // assets/ner.js, which has no State of its own
+        window.__nerEntities = entities || {};
+        // The JSON preview keeps the original exported list shape
+        const jsonStr = JSON.stringify(entityList, null, 2);
+        if (!entityList.length) {
+            return [h('P', {children: 'No entities labeled yet.'}), jsonStr];
+        }
+        // Static card styling lives in assets/ner.css classes; only the
+        // per-label badge colors stay inline. One lookup yields both:
+        // [background, text]
+        const styleMap = (window.__nerBadgeColors ||= {
+            'PERSON': ['#ffeb3b', 'black'],
+            'ORGANIZATION': ['#2196f3', 'white'],
+            'LOCATION': ['#4caf50', 'white'],
+            'MISCELLANEOUS': ['#ff9800', 'white']
+        });
+        const cards = entityList.map(entity => {
+            const [bg, fg] = styleMap[entity.label] || ['#6c757d', 'white'];
+            return h('Div', {
+            children: [
+                h('Span', {children: entity.label,
+                           className: 'ner-badge',
+                           style: {backgroundColor: bg, color: fg}}),
+                h('Span', {children: '"' + entity.text + '"',
+                           className: 'ner-card-text'}),
+                h('Span', {children: ' (position ' + entity.start + '-' + entity.end + ')',
+                           className: 'ner-position'}),
+                h('Button', {children: '\\u00d7',
+                             className: 'ner-remove-btn',
+                             'data-entity-id': String(entity.id),
+                             title: 'Remove entity'})
+            ],
+            className: 'ner-card'
+            });
+        });
+        return [h('Div', {children: cards}), jsonStr];
+    }
+    """,
+    [Output('entities-display', 'children'),
+     Output('entities-json', 'children')],
+    Input('entities-store', 'data'),
     prevent_initial_call=True
 )
-def remove_entity(n_clicks_list, entities):
-    """
-    Remove an entity when its remove button is clicked.
-    
-    This uses pattern-matching callbacks to handle dynamically created remove buttons.
-    Each button has an ID like {'type': 'remove-entity', 'index': entity_id}.
-    
-    Args:
-        n_clicks_list: List of n_clicks values for all remove buttons
-        entities: Current list of entities from the data store
-        
-    Returns:
-        Updated entities list with the clicked entity removed
-    """
-    ctx = dash.callback_context
-    if not ctx.triggered or not any(n_clicks_list):
-        return entities
-    
-    # Get information about which button was clicked
-    triggered = ctx.triggered[0]
-    if triggered['value'] is None or triggered['value'] == 0:
-        return entities
-        
-    # Extract entity ID from the pattern-matching callback prop_id
-    # Format: {"index":123.456,"type":"remove-entity"}.n_clicks
-    prop_id = triggered['prop_id']
-    try:
-        # Use regex to find the entity ID in the JSON-like string
-        import re
-        match = re.search(r'"index":([^,}]+)', prop_id)
-        if match:
-            entity_id = float(match.group(1))  # Convert to float (timestamp + random)
-            
-            # Filter out the entity with the matching ID
-            updated_entities = [entity for entity in entities if entity['id'] != entity_id]
-            return updated_entities
-    except Exception as e:
-        # If parsing fails, return entities unchanged
-        print(f"Error parsing entity ID: {e}")
-        pass
-    
-    return entities
+
+# Entity removal is handled by a single delegated click listener in
+# assets/ner.js: the remove buttons carry data-entity-id and a shared
+# class instead of pattern-matching ids, so the renderer no longer
+# re-evaluates an ALL-matched input list on every click. The listener
+# deletes the id from the mirrored store and pushes the result back via
+# dash_clientside.set_props.
 
 # ========================================
 # RUN THE APPLICATION